@@ -14,7 +14,7 @@ const Home = () => {
   const fetchFeaturedJobs = async () => {
     try {
       setLoadingJobs(true);
-      const jobs = await jobService.searchJobs({ limit: 3 });
+      const { results: jobs } = await jobService.searchJobs({ limit: 3 });
       
       // 👀 Add this line to see exactly what your API is returning
       console.log("Featured Jobs Response:", jobs);
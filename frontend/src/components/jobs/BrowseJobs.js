@@ -8,6 +8,8 @@ import MessageButton from '../../components/MessageButton'; // Add this import
 const BrowseJobs = () => {
   const { user } = useAuth(); // Add this line
   const [jobs, setJobs] = useState([]);
+  // Keyset cursors of the current page; count is only reported for searches
+  const [page, setPage] = useState({ count: null, next: null, previous: null });
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const [filters, setFilters] = useState({
@@ -17,8 +19,8 @@ const BrowseJobs = () => {
     salary: ''
   });
 
-  // Fetch jobs using your existing API service
-  const fetchJobs = useCallback(async () => {
+  // Fetch one page of jobs; cursorUrl is the current page's `next` or `previous` link
+  const fetchJobs = useCallback(async (cursorUrl = null) => {
     setLoading(true);
     setError('');
 
@@ -35,12 +37,14 @@ const BrowseJobs = () => {
           salary: filters.salary
         };
         
-        const data = await jobService.searchJobs(searchFilters);
-        setJobs(Array.isArray(data) ? data : data.results || []);
+        const data = await jobService.searchJobs(searchFilters, cursorUrl);
+        setJobs(data.results || []);
+        setPage({ count: data.count ?? null, next: data.next, previous: data.previous });
       } else {
         // Get all jobs when no filters are applied
-        const data = await jobService.getAllJobs();
-        setJobs(Array.isArray(data) ? data : data.results || []);
+        const data = await jobService.getAllJobs(cursorUrl);
+        setJobs(data.results || []);
+        setPage({ count: null, next: data.next, previous: data.previous });
       }
     } catch (err) {
       console.error('Fetch error:', err);
@@ -154,7 +158,7 @@ const BrowseJobs = () => {
           <Button 
             variant="link" 
             className="p-0 ms-2" 
-            onClick={fetchJobs}
+            onClick={() => fetchJobs()}
           >
             Retry
           </Button>
@@ -169,7 +173,9 @@ const BrowseJobs = () => {
         </div>
       ) : (
         <div className="mb-3">
-          <p className="text-muted">{jobs.length} job(s) found</p>
+          <p className="text-muted">
+            {page.count !== null ? `${page.count} job(s) found` : `Showing ${jobs.length} job(s)`}
+          </p>
           <Row>
             {jobs.map(job => {
               const today = new Date().toISOString().split('T')[0];
@@ -229,6 +235,24 @@ const BrowseJobs = () => {
               );
             })}
           </Row>
+          {(page.previous || page.next) && (
+            <div className="d-flex justify-content-between">
+              <Button
+                variant="outline-secondary"
+                disabled={!page.previous}
+                onClick={() => fetchJobs(page.previous)}
+              >
+                &larr; Previous
+              </Button>
+              <Button
+                variant="outline-secondary"
+                disabled={!page.next}
+                onClick={() => fetchJobs(page.next)}
+              >
+                Next &rarr;
+              </Button>
+            </div>
+          )}
         </div>
       )}
     </Container>
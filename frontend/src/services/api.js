@@ -210,10 +210,33 @@ export const userService = {
 
 
 
+// Job list endpoints are keyset-paginated ({ next, previous, results }).
+// fetchPage returns one page; pass a page's `next`/`previous` URL to move
+// through the cursors. fetchAllPages follows `next` to the end and is only
+// meant for short lists such as an employer's own jobs.
+const MAX_PAGE_SIZE = 100;
+
+const fetchPage = async (url, params = new URLSearchParams(), cursorUrl = null) => {
+  const response = await api.get(cursorUrl || `${url}?${params.toString()}`);
+  return response.data;
+};
+
+const fetchAllPages = async (url) => {
+  let results = [];
+  let next = `${url}?page_size=${MAX_PAGE_SIZE}`;
+  while (next) {
+    const response = await api.get(next);
+    results = results.concat(response.data.results);
+    next = response.data.next;
+  }
+  return results;
+};
+
 // Job service
 export const jobService = {
-  // Search for jobs with filters
-  searchJobs: async (filters = {}) => {
+  // Search for jobs with filters; returns one page ({ count, next, previous, results }).
+  // Pass a page's `next` or `previous` URL as cursorUrl to fetch that page.
+  searchJobs: async (filters = {}, cursorUrl = null) => {
     try {
       const params = new URLSearchParams();
       
@@ -221,19 +244,18 @@ export const jobService = {
       if (filters.location) params.append('location', filters.location);
       if (filters.jobType) params.append('job_type', filters.jobType);
       if (filters.salary) params.append('salary', filters.salary);
+      if (filters.limit) params.append('page_size', filters.limit);
 
-      const response = await api.get(`/api/job-search/?${params.toString()}`);
-      return response.data;
+      return await fetchPage('/api/job-search/', params, cursorUrl);
     } catch (error) {
       throw error.response?.data || { message: 'Failed to fetch jobs' };
     }
   },
 
-  // Get all jobs (no filtering)
-  getAllJobs: async () => {
+  // Get all jobs (no filtering), one page at a time like searchJobs
+  getAllJobs: async (cursorUrl = null) => {
     try {
-      const response = await api.get('/api/jobs/');
-      return response.data;
+      return await fetchPage('/api/jobs/', new URLSearchParams(), cursorUrl);
     } catch (error) {
       throw error.response?.data || { message: 'Failed to fetch all jobs' };
     }
@@ -252,8 +274,7 @@ export const jobService = {
   // Get jobs for the logged-in employer
   getEmployerJobs: async () => {
     try {
-      const response = await api.get('/api/employer/jobs/');
-      return response.data;
+      return await fetchAllPages('/api/employer/jobs/');
     } catch (error) {
       throw error.response?.data || { message: 'Failed to fetch employer jobs' };
     }
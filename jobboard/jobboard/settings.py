@@ -13,6 +13,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 from decouple import config
+from corsheaders.defaults import default_headers
 
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -32,6 +33,8 @@ CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = [
     config('CLIENT_URL', default='http://localhost:3000')
 ]
+# Lets the frontend retry submissions safely (users.idempotency)
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
 
 
 # Application definition
@@ -168,7 +171,65 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
+    # JSON goes through orjson (users.renderers); form and multipart uploads are unchanged
+    'DEFAULT_RENDERER_CLASSES': [
+        'users.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'users.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# Cache backend is pluggable: 'locmem' for a single process, 'file', 'db' or 'redis'
+# when several workers must share cached responses (run `createcachetable` for 'db').
+CACHE_BACKEND = config('CACHE_BACKEND', default='locmem')
+CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'jobboard'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', str(BASE_DIR / 'cache')),
+    'db': ('django.core.cache.backends.db.DatabaseCache', 'jobboard_cache'),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
 }
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND][0],
+        'LOCATION': config('CACHE_LOCATION', default=CACHE_BACKENDS[CACHE_BACKEND][1]),
+        'TIMEOUT': 300,
+    }
+}
+
+# Seconds an anonymous job list/search response stays cached (users.caching)
+JOB_LIST_CACHE_TIMEOUT = config('JOB_LIST_CACHE_TIMEOUT', default=60, cast=int)
+# Seconds a serialized job detail body stays cached; entries are versioned (users.caching)
+JOB_DETAIL_CACHE_TIMEOUT = config('JOB_DETAIL_CACHE_TIMEOUT', default=600, cast=int)
+# Seconds an ETag/Last-Modified version stamp lives; expiry only forces a re-fetch (users.caching)
+VERSION_STAMP_TIMEOUT = config('VERSION_STAMP_TIMEOUT', default=86400, cast=int)
+
+# Job detail views are buffered per process and flushed every N seconds (users.view_counts;
+# 0 writes each view immediately); repeat views by the same user/IP within the dedupe window are not counted (0 disables).
+JOB_VIEW_FLUSH_INTERVAL = config('JOB_VIEW_FLUSH_INTERVAL', default=10, cast=int)
+JOB_VIEW_DEDUPE_WINDOW = config('JOB_VIEW_DEDUPE_WINDOW', default=1800, cast=int)
+
+# Employer activity logged from read endpoints is queued and bulk-written every N seconds
+# (users.activity; 0 writes immediately); "viewed applications" is logged once per job per window.
+EMPLOYER_ACTIVITY_FLUSH_INTERVAL = config('EMPLOYER_ACTIVITY_FLUSH_INTERVAL', default=10, cast=int)
+APPLICATION_VIEW_ACTIVITY_WINDOW = config('APPLICATION_VIEW_ACTIVITY_WINDOW', default=3600, cast=int)
+
+# New jobs are matched against saved searches in a background batch every N seconds
+# (users.percolator; 0 matches them immediately after the job is committed).
+SAVED_SEARCH_PERCOLATE_INTERVAL = config('SAVED_SEARCH_PERCOLATE_INTERVAL', default=10, cast=int)
+
+# Load the near-duplicate LSH index in a background thread on each worker's first request
+# (users.dedupe); when off, the first job POST loads it.
+JOB_DUPLICATE_INDEX_WARM = config('JOB_DUPLICATE_INDEX_WARM', default=True, cast=bool)
+
+# Seconds a create response is kept for replay to retries with the same Idempotency-Key (users.idempotency)
+IDEMPOTENCY_KEY_TTL = config('IDEMPOTENCY_KEY_TTL', default=86400, cast=int)
+
+# Page size for the keyset-paginated job list/search endpoints (users.pagination.KeysetPagination)
+JOB_LIST_PAGE_SIZE = config('JOB_LIST_PAGE_SIZE', default=20, cast=int)
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),
@@ -203,6 +264,15 @@ CRISPY_TEMPLATE_PACK = "bootstrap5"
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# How resumes, job PDFs, profile pictures and logos are sent (users.file_delivery): 'django'
+# streams them from the worker with Range/ETag support; 'x-accel-redirect' (nginx, with an
+# `internal` location at FILE_DELIVERY_INTERNAL_PREFIX aliased to MEDIA_ROOT) or 'x-sendfile'
+# (Apache mod_xsendfile) hand the transfer to the front proxy.
+FILE_DELIVERY_BACKEND = config('FILE_DELIVERY_BACKEND', default='django')
+FILE_DELIVERY_INTERNAL_PREFIX = config('FILE_DELIVERY_INTERNAL_PREFIX', default='/protected-media/')
+# Seconds shared caches may keep public files such as company logos
+FILE_DELIVERY_MAX_AGE = config('FILE_DELIVERY_MAX_AGE', default=3600, cast=int)
+
 CLIENT_URL = config('CLIENT_URL', default='http://localhost:3000')
 BASE_URL = config('BASE_URL', default='http://localhost:8000')
 
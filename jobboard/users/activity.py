@@ -0,0 +1,52 @@
+import atexit
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .buffers import BackgroundBuffer
+from .caching import touch_versions, version_key
+from .models import EmployerActivity
+
+
+class EmployerActivityBuffer(BackgroundBuffer):
+    """
+    Per-process queue of EmployerActivity rows written off the request path.
+
+    A background thread bulk-inserts the queued rows every `flush_interval`
+    seconds; with an interval of 0 each record is written immediately.
+    """
+
+    thread_name = 'employer-activity-writer'
+
+    def empty(self):
+        return []
+
+    def add(self, pending, employer_id, activity_type, description):
+        pending.append(
+            EmployerActivity(employer_id=employer_id, activity_type=activity_type, description=description)
+        )
+
+    def split(self, pending):
+        return [[activity] for activity in pending]
+
+    def write(self, pending):
+        EmployerActivity.objects.bulk_create(pending, batch_size=500)
+        # bulk_create skips the post_save signal that refreshes the dashboard ETag
+        touch_versions(*{version_key('employer', activity.employer_id) for activity in pending})
+        return len(pending)
+
+
+activity_buffer = EmployerActivityBuffer(getattr(settings, 'EMPLOYER_ACTIVITY_FLUSH_INTERVAL', 10))
+atexit.register(activity_buffer.flush)
+
+
+def record_applications_viewed(employer_id, job):
+    """
+    Log one 'application_viewed' activity per employer and job within
+    APPLICATION_VIEW_ACTIVITY_WINDOW seconds; repeats inside the window are dropped.
+    """
+    window = getattr(settings, 'APPLICATION_VIEW_ACTIVITY_WINDOW', 0)
+    if window > 0 and not cache.add(f'activity:application_viewed:{employer_id}:{job.pk}', 1, window):
+        return False
+    activity_buffer.record(employer_id, 'application_viewed', f"Viewed applications for job: '{job.title}'")
+    return True
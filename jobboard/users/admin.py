@@ -14,7 +14,7 @@ import csv
 from .models import (   
     User, Job, JobApplication, CompanyProfile,
     EmployerActivity, JobSeekerProfile, 
-    Message, Notification
+    Message, Notification, Skill, SkillAlias, SavedSearch
 )
 
 # -------------------------
@@ -70,7 +70,7 @@ class CustomUserAdmin(UserAdmin):
 # -------------------------
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
-    list_display = ('title', 'employer', 'job_type', 'status', 'created_at', 'current_status')
+    list_display = ('title', 'employer', 'job_type', 'status', 'application_deadline', 'created_at')
     list_filter = ('job_type', 'status', 'created_at')
     search_fields = ('title', 'description', 'skills_required')
     actions = [export_as_csv, export_as_pdf]
@@ -138,4 +138,26 @@ class NotificationAdmin(admin.ModelAdmin):
     list_display = ('user', 'message', 'is_read', 'created_at')
     list_filter = ('is_read', 'created_at')
     search_fields = ('user__username', 'message')
-    actions = [export_as_csv, export_as_pdf]
\ No newline at end of file
+    actions = [export_as_csv, export_as_pdf]
+
+
+# -------------------------
+# SKILL TAXONOMY ADMIN
+# -------------------------
+class SkillAliasInline(admin.TabularInline):
+    model = SkillAlias
+    extra = 1
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ('name', 'normalized_name')
+    search_fields = ('name', 'normalized_name', 'aliases__alias')
+    inlines = [SkillAliasInline]
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ('name', 'user', 'keyword', 'location', 'job_type', 'min_salary', 'created_at')
+    list_filter = ('job_type',)
+    search_fields = ('name', 'keyword', 'user__username')
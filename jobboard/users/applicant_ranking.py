@@ -0,0 +1,108 @@
+from collections import Counter
+
+import numpy as np
+from django.core.cache import cache
+
+from .models import JobApplication, JobSeekerProfile
+from .search import tokenize
+
+RANKING_CACHE_TIMEOUT = 60 * 60
+
+# Relative weight of each signal in the final score (they sum to 1)
+SKILL_WEIGHT = 0.5
+GPA_WEIGHT = 0.2
+EDUCATION_WEIGHT = 0.15
+MAJOR_WEIGHT = 0.15
+
+# Matched as substrings of the free-text education level, highest first
+EDUCATION_LEVELS = (
+    (('phd', 'ph.d', 'doctor'), 1.0),
+    (('master', 'mba', 'm.tech', 'mtech', 'm.sc', 'msc', 'postgraduate'), 0.8),
+    (('bachelor', 'b.tech', 'btech', 'b.e', 'b.sc', 'bsc', 'undergraduate', 'degree'), 0.6),
+    (('diploma', 'associate'), 0.4),
+    (('high school', 'secondary', '12th', '10th'), 0.2),
+)
+
+
+def education_score(level):
+    level = (level or '').lower()
+    for keywords, score in EDUCATION_LEVELS:
+        if any(keyword in level for keyword in keywords):
+            return score
+    return 0.0
+
+
+def ranking_cache_key(job_id):
+    return f'applicant_ranking:{job_id}'
+
+
+def invalidate_applicant_ranking(job_id):
+    cache.delete(ranking_cache_key(job_id))
+
+
+def invalidate_applicant_rankings(job_ids):
+    cache.delete_many([ranking_cache_key(job_id) for job_id in job_ids])
+
+
+def score_applications(job):
+    """
+    Score every application for `job` in one vectorized pass and return
+    [(application_id, score), ...] best first. Signals: coverage of the job's
+    skill tags by the applicant's profile skill tags, GPA, education level
+    and whether the major shares terms with the job title/skills.
+    """
+    rows = list(
+        JobApplication.objects.filter(job=job)
+        .values_list('pk', 'user_id', 'gpa', 'education_level', 'major')
+    )
+    if not rows:
+        return []
+
+    application_ids, user_ids, gpas, levels, majors = zip(*rows)
+
+    # Fraction of the job's required skills found in the applicant's normalized
+    # profile skills (aliases already resolved by the skill taxonomy)
+    required = list(job.skill_tags.values_list('pk', flat=True))
+    if required:
+        profile_skills = JobSeekerProfile.skill_tags.through.objects.filter(
+            jobseekerprofile__user_id__in=set(user_ids), skill_id__in=required
+        ).values_list('jobseekerprofile__user_id', flat=True)
+        hits = Counter(profile_skills)
+        skill_scores = np.array([hits[user_id] for user_id in user_ids], dtype=np.float64) / len(required)
+    else:
+        skill_scores = np.zeros(len(rows))
+
+    # GPAs above 4 are assumed to be on a 10-point scale
+    gpa = np.array([value if value is not None else np.nan for value in gpas], dtype=np.float64)
+    gpa_scores = np.where(gpa > 4, gpa / 10, gpa / 4)
+    gpa_scores = np.clip(np.nan_to_num(gpa_scores, nan=0.0), 0, 1)
+
+    education_scores = np.array([education_score(level) for level in levels], dtype=np.float64)
+
+    job_vocabulary = set(tokenize(f"{job.title} {job.skills_required}"))
+    major_scores = np.array(
+        [1.0 if job_vocabulary & set(tokenize(major)) else 0.0 for major in majors],
+        dtype=np.float64,
+    )
+
+    scores = (
+        SKILL_WEIGHT * skill_scores
+        + GPA_WEIGHT * gpa_scores
+        + EDUCATION_WEIGHT * education_scores
+        + MAJOR_WEIGHT * major_scores
+    )
+    order = np.argsort(-scores, kind='stable')
+    return [(application_ids[index], round(float(scores[index]), 4)) for index in order]
+
+
+def applicant_ranking(job):
+    """
+    Cached `score_applications`; dropped whenever an application, the job's
+    skills or an applicant's profile skills change (users.signals).
+    """
+    key = ranking_cache_key(job.pk)
+    ranking = cache.get(key)
+    if ranking is None:
+        ranking = score_applications(job)
+        cache.set(key, ranking, RANKING_CACHE_TIMEOUT)
+    return ranking
@@ -0,0 +1,93 @@
+import logging
+import threading
+import time
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundBuffer:
+    """
+    Per-process queue of writes kept off the request path.
+
+    `record()` adds to the pending batch; a background thread writes it every
+    `flush_interval` seconds, or immediately with an interval of 0. When a
+    batch fails, its items are retried one at a time so a permanently bad item
+    (say, a row whose employer was deleted before the flush) cannot block the
+    rest; an item still failing after `max_attempts` is logged and dropped.
+
+    Subclasses define how items accumulate and how a batch is written:
+    `empty()`, `add(pending, *args)`, `split(pending)` and `write(pending)`.
+    """
+
+    thread_name = 'background-buffer'
+    max_attempts = 3
+
+    def __init__(self, flush_interval):
+        self.flush_interval = flush_interval
+        self._pending = self.empty()
+        self._retries = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def empty(self):
+        raise NotImplementedError
+
+    def add(self, pending, *args):
+        raise NotImplementedError
+
+    def split(self, pending):
+        """Single-item batches of `pending`, written separately after a failure."""
+        raise NotImplementedError
+
+    def write(self, pending):
+        """Write a batch; returns the number of items written and raises on failure."""
+        raise NotImplementedError
+
+    def record(self, *args):
+        with self._lock:
+            self.add(self._pending, *args)
+        if self.flush_interval <= 0:
+            self.flush()
+        else:
+            self._ensure_thread()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, self.empty()
+            retries, self._retries = self._retries, []
+        written = 0
+        if pending:
+            try:
+                written += self.write(pending)
+            except Exception:
+                logger.warning("%s: batch write failed; retrying its items one at a time.", self.thread_name)
+                retries.extend((item, 0) for item in self.split(pending))
+
+        for item, attempts in retries:
+            try:
+                written += self.write(item)
+            except Exception:
+                if attempts + 1 < self.max_attempts:
+                    with self._lock:
+                        self._retries.append((item, attempts + 1))
+                else:
+                    # Items are not formatted: a model row's __str__ may query the missing FK target
+                    logger.exception("%s: dropping an item after %d failed attempts.", self.thread_name, attempts + 1)
+        return written
+
+    def _ensure_thread(self):
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+            close_old_connections()
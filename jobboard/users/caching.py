@@ -0,0 +1,147 @@
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+JOB_LIST_GENERATION_KEY = 'job_list:generation'
+
+
+def job_list_generation():
+    generation = cache.get(JOB_LIST_GENERATION_KEY)
+    if generation is None:
+        cache.add(JOB_LIST_GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(JOB_LIST_GENERATION_KEY, 1)
+    return generation
+
+
+def invalidate_job_lists():
+    # Bumping the generation orphans every cached listing at once; old entries
+    # simply expire instead of having to be enumerated and deleted.
+    try:
+        cache.incr(JOB_LIST_GENERATION_KEY)
+    except ValueError:
+        cache.set(JOB_LIST_GENERATION_KEY, 2, timeout=None)
+
+
+def normalized_query(query_params):
+    items = []
+    for key in sorted(query_params):
+        values = sorted(value.strip() for value in query_params.getlist(key) if value.strip())
+        items.extend((key, value) for value in values)
+    return urlencode(items)
+
+
+def job_list_cache_key(request):
+    raw = f"{request.get_host()}{request.path}?{normalized_query(request.query_params)}"
+    digest = hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    return f"job_list:{job_list_generation()}:{digest}"
+
+
+class AnonymousJobListCacheMixin:
+    """
+    Serve anonymous GET list responses from the shared cache. Authenticated
+    users bypass it because their payload carries per-user fields.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+
+        key = job_list_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.JOB_LIST_CACHE_TIMEOUT)
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method == 'GET' and response.status_code == 200:
+            # Anonymous listings may be kept by browsers and shared proxies for as
+            # long as our own cache keeps them
+            if request.user.is_authenticated:
+                patch_cache_control(response, private=True, no_cache=True)
+            else:
+                patch_cache_control(response, public=True, max_age=settings.JOB_LIST_CACHE_TIMEOUT)
+            patch_vary_headers(response, ['Authorization'])
+        return response
+
+
+def version_key(scope, pk=None):
+    return f'version:{scope}' if pk is None else f'version:{scope}:{pk}'
+
+
+def version_stamps(keys):
+    """
+    Modification stamps (unix times) for `keys`. A missing stamp starts at the
+    current time, so evicting it can only make clients re-fetch, never serve
+    stale data. Stamps expire after VERSION_STAMP_TIMEOUT seconds, so keys for
+    ids that do not exist cannot pile up in the cache.
+    """
+    stamps = cache.get_many(keys)
+    missing = [key for key in keys if key not in stamps]
+    if missing:
+        now = time.time()
+        timeout = getattr(settings, 'VERSION_STAMP_TIMEOUT', 60 * 60 * 24)
+        for key in missing:
+            cache.add(key, now, timeout=timeout)
+        stamps.update(cache.get_many(missing))
+        for key in missing:
+            stamps.setdefault(key, now)
+    return [stamps[key] for key in keys]
+
+
+def touch_versions(*keys):
+    # Dropped once the write is committed; the next read starts a fresh stamp
+    keys = list(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def job_detail_cache_key(job_id):
+    # Tied to the job's version stamp, so any write to the job, its applications,
+    # its view count or its company profile orphans the cached body
+    stamp = version_stamps([version_key('job', job_id)])[0]
+    return f'job_detail:{job_id}:{stamp!r}'
+
+
+def invalidate_job_detail(job_id):
+    touch_versions(version_key('job', job_id))
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET support for per-user endpoints. Views call
+    `check_not_modified()` before doing any serialization work; it builds an
+    ETag and Last-Modified value from the version stamps returned by
+    `get_version_keys()` and returns a 304 response when the client's copy
+    is still current.
+    """
+
+    def get_version_keys(self, request, obj=None):
+        raise NotImplementedError
+
+    def check_not_modified(self, request, obj=None):
+        stamps = version_stamps(self.get_version_keys(request, obj))
+        raw = '|'.join([request.get_full_path(), str(request.user.pk)] + [repr(stamp) for stamp in stamps])
+        self.etag = f'"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+        self.last_modified = int(max(stamps))
+        return get_conditional_response(request, etag=self.etag, last_modified=self.last_modified)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method in ('GET', 'HEAD') and response.status_code in (200, 304) and getattr(self, 'etag', None):
+            response['ETag'] = self.etag
+            response['Last-Modified'] = http_date(self.last_modified)
+            # Responses carry per-user fields: browsers may keep them but must revalidate
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ['Authorization'])
+        return response
@@ -0,0 +1,29 @@
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import CompanyProfile, Job
+
+
+def company_fields(employer_id):
+    """The denormalized company display fields for a new job of `employer_id`."""
+    profile = CompanyProfile.objects.filter(employer_id=employer_id).values('company_name', 'logo').first()
+    if profile is None:
+        return {'company_name': '', 'company_logo': ''}
+    return {'company_name': profile['company_name'], 'company_logo': profile['logo'] or ''}
+
+
+def sync_company_fields(profile):
+    # One UPDATE over all of the employer's jobs
+    return Job.objects.filter(employer_id=profile.employer_id).update(
+        company_name=profile.company_name,
+        company_logo=profile.logo.name if profile.logo else '',
+    )
+
+
+def backfill_company_fields(job_ids):
+    """Recopy the company fields of `job_ids` from their profiles in a single UPDATE."""
+    profiles = CompanyProfile.objects.filter(employer_id=OuterRef('employer_id'))
+    return Job.objects.filter(pk__in=job_ids).update(
+        company_name=Coalesce(Subquery(profiles.values('company_name')[:1]), Value('')),
+        company_logo=Coalesce(Subquery(profiles.values('logo')[:1]), Value('')),
+    )
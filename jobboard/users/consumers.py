@@ -1,4 +1,3 @@
-import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -6,6 +5,7 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 from .models import Message
+from .renderers import dumps, loads
 from .serializers import MessageSerializer
 
 User = get_user_model()
@@ -57,7 +57,7 @@ class ChatConsumer(AsyncWebsocketConsumer):
     async def receive(self, text_data):
         logger.info(f"Received message from {self.user.username}: {text_data}")
         try:
-            text_data_json = json.loads(text_data)
+            text_data_json = loads(text_data)
             message_content = text_data_json['message']
 
             if not message_content.strip():
@@ -78,17 +78,17 @@ class ChatConsumer(AsyncWebsocketConsumer):
                     'message': message_data,
                 }
             )
-        except (KeyError, json.JSONDecodeError) as e:
+        except (KeyError, ValueError) as e:
             logger.error(f"Error processing received message: {e}")
 
     async def chat_message(self, event):
         message = event['message']
         logger.info(f"Sending message to client {self.user.username}: {message}")
 
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=dumps({
             'type': 'chat_message',
             'message': message
-        }))
+        }).decode())
 
     @sync_to_async
     def save_message(self, message_content):
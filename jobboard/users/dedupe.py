@@ -0,0 +1,216 @@
+import logging
+import threading
+import zlib
+from collections import defaultdict
+from datetime import timedelta
+
+import numpy as np
+from django.db import connection, connections
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import JobSignature
+from .search import tokenize
+
+logger = logging.getLogger(__name__)
+
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 3
+# Estimated Jaccard similarity above which a posting counts as a duplicate
+DUPLICATE_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_random = np.random.RandomState(20240817)
+# Fixed seed: signatures must be comparable across processes and restarts
+_A = _random.randint(1, 1 << 31, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_B = _random.randint(0, 1 << 31, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def shingles(text):
+    tokens = tokenize(text)
+    if len(tokens) < SHINGLE_SIZE:
+        return set(tokens)
+    return {' '.join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+
+
+def minhash(title, description):
+    """MinHash signature (uint32[NUM_PERMUTATIONS]) of the title + description, or None if empty."""
+    shingle_set = shingles(f"{title} {description}")
+    if not shingle_set:
+        return None
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode('utf-8')) for shingle in shingle_set),
+        dtype=np.uint64, count=len(shingle_set),
+    )
+    # (a * h + b) mod p for every permutation/shingle pair, minimum per permutation
+    permuted = (_A[:, None] * hashes[None, :] + _B[:, None]) % _MERSENNE_PRIME
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def to_bytes(signature):
+    return signature.astype('<u4').tobytes()
+
+
+def from_bytes(data):
+    return np.frombuffer(bytes(data), dtype='<u4')
+
+
+def band_keys(signature):
+    return [
+        hash((band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes()))
+        for band in range(BANDS)
+    ]
+
+
+class LSHIndex:
+    """
+    In-memory banded LSH over the signatures of all jobs.
+
+    Loaded in the background by `warm()` (or by the first lookup, if that comes
+    sooner) and caught up incrementally from JobSignature.updated_at, so edited
+    postings are re-bucketed in every process. A lookup costs one indexed
+    catch-up query plus BANDS dictionary probes instead of a comparison against
+    every job.
+    """
+
+    # Signatures written shortly before the previous refresh are read again, so
+    # a transaction that commits after the refresh started is not missed
+    REFRESH_OVERLAP = timedelta(seconds=30)
+
+    def __init__(self):
+        self._buckets = defaultdict(set)
+        self._keys = {}
+        self._refreshed_at = None
+        self._lock = threading.Lock()
+        self._warm_thread = None
+
+    def add(self, job_id, signature):
+        keys = band_keys(signature)
+        previous = self._keys.get(job_id)
+        if previous == keys:
+            return
+        if previous:
+            for key in previous:
+                bucket = self._buckets[key]
+                bucket.discard(job_id)
+                if not bucket:
+                    del self._buckets[key]
+        for key in keys:
+            self._buckets[key].add(job_id)
+        self._keys[job_id] = keys
+
+    def refresh(self):
+        with self._lock:
+            started = timezone.now()
+            rows = JobSignature.objects.order_by().values_list('job_id', 'signature')
+            if self._refreshed_at is not None:
+                rows = rows.filter(updated_at__gte=self._refreshed_at - self.REFRESH_OVERLAP)
+            for job_id, data in rows.iterator(chunk_size=2000):
+                self.add(job_id, from_bytes(data))
+            self._refreshed_at = started
+
+    def warm(self):
+        """Start the initial full load in a background thread; later calls do nothing."""
+        if self._warm_thread is not None:
+            return
+        with self._lock:
+            if self._warm_thread is not None or self._refreshed_at is not None:
+                return
+            self._warm_thread = threading.Thread(target=self._warm, name='job-lsh-warmer', daemon=True)
+            self._warm_thread.start()
+
+    def _warm(self):
+        try:
+            self.refresh()
+        except Exception:
+            # The next lookup loads the index itself
+            logger.exception("Failed to warm the job LSH index.")
+        finally:
+            connections.close_all()
+
+    def candidates(self, signature, refresh=True):
+        if refresh:
+            self.refresh()
+        found = set()
+        for key in band_keys(signature):
+            found.update(self._buckets.get(key, ()))
+        return found
+
+
+job_lsh = LSHIndex()
+
+
+def _best_match(signature, rows):
+    if not rows:
+        return None
+    matrix = np.vstack([from_bytes(data) for _, _, data in rows])
+    similarity = (matrix == signature).mean(axis=1)
+    best = int(similarity.argmax())
+    if similarity[best] < DUPLICATE_THRESHOLD:
+        return None
+    job_id, job_title, _ = rows[best]
+    return job_id, job_title, round(float(similarity[best]), 3)
+
+
+def _candidate_rows(employer, candidates):
+    # Only LSH candidates are compared; of those, the employer's own jobs count
+    # in any status and everyone else's only while active
+    if not candidates:
+        return []
+    return list(
+        JobSignature.objects.filter(Q(job__status='active') | Q(job__employer=employer), job_id__in=candidates)
+        .values_list('job_id', 'job__title', 'signature')
+    )
+
+
+def find_duplicate(employer, title, description, exclude_id=None):
+    """
+    Return (job_id, title, similarity) for the closest near-duplicate among the
+    employer's own jobs and all active jobs, or None.
+    """
+    signature = minhash(title, description)
+    if signature is None:
+        return None
+    candidates = job_lsh.candidates(signature)
+    candidates.discard(exclude_id)
+    return _best_match(signature, _candidate_rows(employer, candidates))
+
+
+def find_duplicates(employer, jobs):
+    """
+    `find_duplicate` for a batch of unsaved jobs: one catch-up query and one
+    query for the candidate signatures of the whole batch. Returns a match or
+    None per job, in order.
+    """
+    signatures = [minhash(job.title, job.description) for job in jobs]
+    job_lsh.refresh()
+    candidates = [
+        job_lsh.candidates(signature, refresh=False) if signature is not None else set()
+        for signature in signatures
+    ]
+    rows = _candidate_rows(employer, set().union(*candidates))
+    rows_by_id = {row[0]: row for row in rows}
+    return [
+        _best_match(signature, [rows_by_id[job_id] for job_id in found if job_id in rows_by_id])
+        if signature is not None else None
+        for signature, found in zip(signatures, candidates)
+    ]
+
+
+def store_signatures(jobs):
+    """Compute and upsert MinHash signatures for an iterable of jobs."""
+    signatures = []
+    for job in jobs:
+        signature = minhash(job.title, job.description)
+        if signature is not None:
+            signatures.append(JobSignature(job_id=job.pk, signature=to_bytes(signature)))
+    # MySQL upserts on any unique key and rejects an explicit conflict target
+    target = ['job'] if connection.features.supports_update_conflicts_with_target else None
+    JobSignature.objects.bulk_create(
+        signatures,
+        update_conflicts=True,
+        unique_fields=target,
+        update_fields=['signature', 'updated_at'],
+    )
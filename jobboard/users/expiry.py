@@ -0,0 +1,27 @@
+from datetime import date
+
+from .caching import invalidate_job_lists, touch_versions, version_key
+from .models import Job
+
+
+def expire_jobs(batch_size=1000, today=None):
+    """
+    Flip active jobs whose application deadline has passed to 'inactive',
+    `batch_size` rows per UPDATE so the sweep never holds long row locks.
+    Returns the number of jobs expired.
+    """
+    today = today or date.today()
+    expired = 0
+    while True:
+        job_ids = list(
+            Job.objects.filter(status='active', application_deadline__lt=today)
+            .order_by().values_list('pk', flat=True)[:batch_size]
+        )
+        if not job_ids:
+            break
+        expired += Job.objects.filter(pk__in=job_ids, status='active').update(status='inactive')
+        touch_versions(*(version_key('job', job_id) for job_id in job_ids))
+
+    if expired:
+        invalidate_job_lists()
+    return expired
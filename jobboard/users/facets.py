@@ -0,0 +1,39 @@
+from django.db.models import Count
+
+from .queries import salary_filter
+
+# Keys match the salary filter values used by the frontend
+SALARY_BANDS = {
+    '0-500000': salary_filter(0, 500000),
+    '500000-1000000': salary_filter(500000, 1000000),
+    '1000000-2000000': salary_filter(1000000, 2000000),
+    '2000000+': salary_filter(2000000),
+}
+
+FACET_FIELDS = ('job_type', 'location_state', 'location_city')
+
+
+def job_facets(queryset):
+    """
+    Count the jobs in `queryset` per job type, state, city and salary band
+    with a single GROUP BY; the per-field totals are folded together in Python.
+    """
+    band_aliases = {f'band_{index}': band for index, band in enumerate(SALARY_BANDS)}
+    rows = (
+        queryset.order_by()
+        .values(*FACET_FIELDS)
+        .annotate(
+            total=Count('pk'),
+            **{alias: Count('pk', filter=SALARY_BANDS[band]) for alias, band in band_aliases.items()}
+        )
+    )
+
+    facets = {field: {} for field in FACET_FIELDS}
+    facets['salary'] = dict.fromkeys(SALARY_BANDS, 0)
+    for row in rows:
+        for field in FACET_FIELDS:
+            value = row[field]
+            facets[field][value] = facets[field].get(value, 0) + row['total']
+        for alias, band in band_aliases.items():
+            facets['salary'][band] += row[alias]
+    return facets
@@ -0,0 +1,211 @@
+import hashlib
+import mimetypes
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core import signing
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.crypto import constant_time_compare
+from django.utils.http import content_disposition_header, http_date
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def file_etag(name, size, modified):
+    digest = hashlib.sha1(f"{name}:{size}:{modified}".encode('utf-8')).hexdigest()
+    return f'"{digest}"'
+
+
+def file_version(name):
+    # Storage names are unique per upload, so a replaced file gets a new version
+    return hashlib.sha1(name.encode('utf-8')).hexdigest()[:12]
+
+
+def sign_file_path(path):
+    return signing.Signer(salt='users.file_delivery').signature(path)
+
+
+def has_file_signature(request, field_file):
+    """
+    True if the request's `sig` was issued for this path and the current version
+    of `field_file`. Signed URLs work as `<img src>`, which carries no
+    Authorization header; replacing the file retires them.
+    """
+    if not field_file:
+        return False
+    version = file_version(field_file.name)
+    return request.GET.get('v') == version and constant_time_compare(
+        request.GET.get('sig', ''), sign_file_path(f"{request.path}?v={version}")
+    )
+
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive for a single `bytes=` range, None to ignore the
+    header (absent, malformed or multi-range) or False if unsatisfiable.
+    """
+    match = RANGE_RE.match((header or '').strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first == '':
+        # Suffix range: the final N bytes
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _iter_range(file, start, length, chunk_size=FileResponse.block_size):
+    try:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(chunk_size, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+class FileDelivery:
+    """Base class: builds the response headers every backend shares."""
+
+    def serve(self, request, field_file, as_attachment=False, filename=None, public=False):
+        raise NotImplementedError
+
+    def headers(self, field_file, as_attachment, filename, public):
+        name = filename or field_file.name.rsplit('/', 1)[-1]
+        content_type, _ = mimetypes.guess_type(name)
+        headers = {
+            'Content-Type': content_type or 'application/octet-stream',
+            'Content-Disposition': content_disposition_header(as_attachment, name),
+        }
+        if public:
+            headers['Cache-Control'] = f"public, max-age={getattr(settings, 'FILE_DELIVERY_MAX_AGE', 3600)}"
+        else:
+            headers['Cache-Control'] = 'private, no-cache'
+        return headers
+
+
+class DjangoFileDelivery(FileDelivery):
+    """
+    Serve the file from the app worker with ETag/Last-Modified validation and
+    single-range `Range` requests, so revalidations cost a stat instead of a
+    transfer and interrupted downloads resume where they stopped.
+    """
+
+    def serve(self, request, field_file, as_attachment=False, filename=None, public=False):
+        storage, name = field_file.storage, field_file.name
+        try:
+            size = storage.size(name)
+        except FileNotFoundError:
+            raise Http404("File not found.")
+        try:
+            modified = storage.get_modified_time(name)
+        except NotImplementedError:
+            modified = None
+        last_modified = modified.timestamp() if modified else None
+        etag = file_etag(name, size, last_modified)
+
+        headers = self.headers(field_file, as_attachment, filename, public)
+        conditional = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if conditional is not None:
+            return self.finish(conditional, headers, etag, last_modified, include_content=False)
+
+        byte_range = None
+        if request.method == 'GET' and 'HTTP_RANGE' in request.META:
+            # A Range with a stale If-Range validator falls back to the whole file
+            if_range = request.META.get('HTTP_IF_RANGE')
+            if if_range is None or if_range == etag:
+                byte_range = parse_range(request.META['HTTP_RANGE'], size)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return self.finish(response, headers, etag, last_modified, include_content=False)
+
+        try:
+            file = storage.open(name, 'rb')
+        except FileNotFoundError:
+            raise Http404("File not found.")
+        if byte_range is None:
+            response = FileResponse(file)
+            response['Content-Length'] = size
+        else:
+            start, end = byte_range
+            response = StreamingHttpResponse(_iter_range(file, start, end - start + 1), status=206)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = end - start + 1
+        return self.finish(response, headers, etag, last_modified)
+
+    def finish(self, response, headers, etag, last_modified, include_content=True):
+        for header, value in headers.items():
+            if include_content or header == 'Cache-Control':
+                response[header] = value
+        response['Accept-Ranges'] = 'bytes'
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class XAccelRedirectDelivery(FileDelivery):
+    """
+    Hand the transfer to nginx. FILE_DELIVERY_INTERNAL_PREFIX must map to
+    MEDIA_ROOT through an `internal` location; nginx handles ranges and
+    validators itself, so the worker is free as soon as the headers are sent.
+    """
+
+    def serve(self, request, field_file, as_attachment=False, filename=None, public=False):
+        response = HttpResponse()
+        for header, value in self.headers(field_file, as_attachment, filename, public).items():
+            response[header] = value
+        prefix = getattr(settings, 'FILE_DELIVERY_INTERNAL_PREFIX', '/protected-media/')
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(field_file.name)
+        return response
+
+
+class XSendfileDelivery(FileDelivery):
+    """Hand the transfer to Apache mod_xsendfile (or lighttpd) by absolute path."""
+
+    def serve(self, request, field_file, as_attachment=False, filename=None, public=False):
+        try:
+            path = field_file.path
+        except NotImplementedError:
+            # Remote storage has no local path for the proxy to read
+            return DjangoFileDelivery().serve(request, field_file, as_attachment, filename, public)
+        response = HttpResponse()
+        for header, value in self.headers(field_file, as_attachment, filename, public).items():
+            response[header] = value
+        response['X-Sendfile'] = path
+        return response
+
+
+FILE_DELIVERY_BACKENDS = {
+    'django': DjangoFileDelivery,
+    'x-accel-redirect': XAccelRedirectDelivery,
+    'x-sendfile': XSendfileDelivery,
+}
+
+
+def file_delivery():
+    return FILE_DELIVERY_BACKENDS[getattr(settings, 'FILE_DELIVERY_BACKEND', 'django')]()
+
+
+def serve_file(request, field_file, as_attachment=False, filename=None, public=False):
+    """
+    Respond with `field_file` through the configured FILE_DELIVERY_BACKEND.
+    Callers do their permission checks first; `public` files may be cached
+    by shared caches, everything else is private.
+    """
+    if not field_file:
+        raise Http404("File not found.")
+    return file_delivery().serve(request, field_file, as_attachment, filename, public)
@@ -1,6 +1,9 @@
 import django_filters
-from django.db.models import Q
+from rest_framework import serializers
 from .models import Job
+from .queries import location_filter, salary_filter
+from .search import rank_jobs
+from .serializers import JobQuerySerializer
 
 class JobFilter(django_filters.FilterSet):
     keyword = django_filters.CharFilter(method='filter_by_keyword', label="Keyword")
@@ -11,25 +14,18 @@ class JobFilter(django_filters.FilterSet):
         model = Job
         fields = ['job_type']
 
+    # Same predicates as users.queries.compile_job_query, for django-filter users
     def filter_by_keyword(self, queryset, name, value):
-        return queryset.filter(
-            Q(title__icontains=value) | Q(description__icontains=value) | Q(skills_required__icontains=value)
-        )
+        return rank_jobs(queryset, value)
 
     def filter_by_location(self, queryset, name, value):
-        return queryset.filter(
-            Q(location_city__icontains=value) | Q(location_state__icontains=value)
-        )
+        return queryset.filter(location_filter(value))
 
     def filter_by_salary(self, queryset, name, value):
         try:
-            if '-' in value:
-                min_salary, max_salary = value.split('-')
-                return queryset.filter(salary_min__gte=int(min_salary), salary_max__lte=int(max_salary))
-            elif value.endswith('+'):
-                min_salary = value[:-1]
-                return queryset.filter(salary_min__gte=int(min_salary))
-            else:
-                return queryset
-        except (ValueError, TypeError):
+            salary = JobQuerySerializer().validate_salary(value)
+        except serializers.ValidationError:
             return queryset
+        if salary is None:
+            return queryset
+        return queryset.filter(salary_filter(*salary))
@@ -0,0 +1,89 @@
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from .models import Job, JobApplication, JobFunnel
+
+FUNNEL_STATUSES = [status for status, _ in JobApplication.STATUS_CHOICES]
+
+
+def empty_funnel():
+    return dict.fromkeys(FUNNEL_STATUSES, 0)
+
+
+def adjust_funnel(job_id, deltas):
+    """Apply {status: +/-n} to a job's funnel row in one UPDATE, creating the row for increments."""
+    deltas = {status: delta for status, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    if any(delta > 0 for delta in deltas.values()):
+        JobFunnel.objects.bulk_create([JobFunnel(job_id=job_id)], ignore_conflicts=True)
+    # Decrements never create rows: they also run while a job's applications are cascade-deleted
+    JobFunnel.objects.filter(job_id=job_id).update(
+        updated_at=timezone.now(),
+        **{status: F(status) + delta for status, delta in deltas.items()},
+    )
+
+
+def funnel_counts(job_ids):
+    """{job_id: {status: count}} for `job_ids`; jobs without a row get zeros."""
+    counts = {job_id: empty_funnel() for job_id in job_ids}
+    for row in JobFunnel.objects.filter(job_id__in=job_ids).values('job_id', *FUNNEL_STATUSES):
+        counts[row.pop('job_id')] = row
+    return counts
+
+
+def employer_funnel(employer):
+    totals = JobFunnel.objects.filter(job__employer=employer).aggregate(
+        **{status: Sum(status) for status in FUNNEL_STATUSES}
+    )
+    funnel = {status: totals[status] or 0 for status in FUNNEL_STATUSES}
+    funnel['views'] = Job.objects.filter(employer=employer).aggregate(total=Sum('views'))['total'] or 0
+    return funnel
+
+
+def reconcile_funnels(batch_size=1000):
+    """
+    Recount every job's funnel from JobApplication with one GROUP BY per batch
+    of jobs and rewrite the rows that drifted. Returns (jobs checked, rows fixed).
+    """
+    checked = corrected = 0
+    last_pk = 0
+    while True:
+        job_ids = list(Job.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not job_ids:
+            break
+        last_pk = job_ids[-1]
+        checked += len(job_ids)
+
+        actual = defaultdict(empty_funnel)
+        for job_id, status, total in (
+            JobApplication.objects.filter(job_id__in=job_ids)
+            .values_list('job_id', 'status').annotate(total=Count('pk')).order_by()
+        ):
+            if status in FUNNEL_STATUSES:
+                actual[job_id][status] = total
+        stored = {
+            row.pop('job_id'): row
+            for row in JobFunnel.objects.filter(job_id__in=job_ids).values('job_id', *FUNNEL_STATUSES)
+        }
+        # A missing row reads as all zeros
+        drifted = [
+            JobFunnel(job_id=job_id, updated_at=timezone.now(), **actual[job_id])
+            for job_id in job_ids
+            if stored.get(job_id, empty_funnel()) != actual[job_id]
+        ]
+        if drifted:
+            # MySQL upserts on any unique key and rejects an explicit conflict target
+            target = ['job'] if connection.features.supports_update_conflicts_with_target else None
+            with transaction.atomic():
+                JobFunnel.objects.bulk_create(
+                    drifted,
+                    update_conflicts=True,
+                    unique_fields=target,
+                    update_fields=[*FUNNEL_STATUSES, 'updated_at'],
+                )
+            corrected += len(drifted)
+    return checked, corrected
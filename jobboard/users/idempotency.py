@@ -0,0 +1,78 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+IDEMPOTENCY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+# How long a request may hold its key before a retry is allowed to run again
+IN_FLIGHT_TIMEOUT = 60
+
+
+def idempotency_cache_key(request, key):
+    raw = f"{request.user.pk}:{request.path}:{key}"
+    return f"idempotency:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+
+def request_fingerprint(request):
+    data = request.data
+    items = data.items() if hasattr(data, 'items') else enumerate(data)
+    raw = repr(sorted((str(name), str(value)) for name, value in items))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class IdempotentCreateMixin:
+    """
+    Honour an `Idempotency-Key` header on create. The first successful response
+    is stored per user, path and key for IDEMPOTENCY_KEY_TTL seconds and
+    replayed for retries carrying the same key, so a client retrying a timed-out
+    POST never creates a second row. Requests without the header are unaffected.
+    """
+
+    def create(self, request, *args, **kwargs):
+        key = request.META.get(IDEMPOTENCY_HEADER, '').strip()
+        if not key or not request.user.is_authenticated:
+            return super().create(request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'detail': f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cache_key = idempotency_cache_key(request, key)
+        fingerprint = request_fingerprint(request)
+        if not cache.add(cache_key, (fingerprint, None, None), IN_FLIGHT_TIMEOUT):
+            stored = cache.get(cache_key)
+            if stored is not None:
+                return self.replay(fingerprint, *stored)
+
+        try:
+            response = super().create(request, *args, **kwargs)
+        except Exception:
+            cache.delete(cache_key)
+            raise
+        if status.is_success(response.status_code):
+            cache.set(
+                cache_key,
+                (fingerprint, response.status_code, dict(response.data)),
+                getattr(settings, 'IDEMPOTENCY_KEY_TTL', 60 * 60 * 24),
+            )
+        else:
+            # Only successes are remembered; a failed attempt may be retried as-is
+            cache.delete(cache_key)
+        return response
+
+    def replay(self, fingerprint, stored_fingerprint, status_code, data):
+        if stored_fingerprint != fingerprint:
+            return Response(
+                {'detail': "This Idempotency-Key was already used for a different request."},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        if status_code is None:
+            return Response(
+                {'detail': "A request with this Idempotency-Key is still being processed."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(data, status=status_code, headers={'Idempotent-Replayed': 'true'})
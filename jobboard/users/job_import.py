@@ -0,0 +1,124 @@
+import codecs
+import csv
+
+import orjson
+from django.db import connection, transaction
+
+from .caching import invalidate_job_lists, touch_versions, version_key
+from .company_fields import company_fields
+from .dedupe import find_duplicates, store_signatures
+from .models import EmployerActivity, Job
+from .percolator import queue_percolation
+from .search import index_jobs
+from .serializers import JobSerializer
+from .skills import sync_job_skills
+
+IMPORT_CHUNK_SIZE = 500
+# Only the first errors are echoed back so the response stays small for any file size
+MAX_REPORTED_ERRORS = 100
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+
+def import_format(uploaded_file, requested=None):
+    if requested:
+        return requested.lower() if requested.lower() in IMPORT_FORMATS else None
+    name = (uploaded_file.name or '').lower()
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return None
+
+
+def iter_csv_rows(uploaded_file):
+    # Django files iterate line by line, so only the current row is held in memory;
+    # blank cells count as missing values
+    for row in csv.DictReader(codecs.iterdecode(uploaded_file, 'utf-8-sig')):
+        yield {key.strip(): value for key, value in row.items() if key and value not in ('', None)}
+
+
+def iter_ndjson_rows(uploaded_file):
+    for line in uploaded_file:
+        if not line.strip():
+            continue
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError as exc:
+            yield ValueError(f"Invalid JSON: {exc}")
+            continue
+        yield row if isinstance(row, dict) else ValueError("Each line must be a JSON object.")
+
+
+def import_jobs(employer, rows, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Validate `rows` (dicts, or exceptions for unparseable rows) with JobSerializer
+    and insert the valid ones `chunk_size` at a time. Returns a summary with
+    per-row errors and near-duplicates; invalid rows never abort the import.
+    """
+    summary = {'created': 0, 'rejected': 0, 'errors': [], 'errors_truncated': False, 'duplicates': []}
+    company = company_fields(employer.pk)
+    chunk = []
+    for number, row in enumerate(rows, start=1):
+        if isinstance(row, Exception):
+            _reject(summary, number, {'non_field_errors': [str(row)]})
+            continue
+        serializer = JobSerializer(data=row)
+        if not serializer.is_valid():
+            _reject(summary, number, serializer.errors)
+            continue
+        chunk.append((number, Job(employer=employer, **company, **serializer.validated_data)))
+        if len(chunk) >= chunk_size:
+            summary['created'] += _create_jobs(employer, chunk, summary)
+            chunk = []
+    if chunk:
+        summary['created'] += _create_jobs(employer, chunk, summary)
+
+    if summary['created']:
+        invalidate_job_lists()
+        touch_versions(version_key('employer', employer.pk), version_key('site'))
+    EmployerActivity.objects.create(
+        employer=employer,
+        activity_type='jobs_imported',
+        description=f"Imported {summary['created']} jobs ({summary['rejected']} rows rejected)",
+    )
+    return summary
+
+
+def _reject(summary, number, errors):
+    summary['rejected'] += 1
+    if len(summary['errors']) < MAX_REPORTED_ERRORS:
+        summary['errors'].append({'row': number, 'errors': errors})
+    else:
+        summary['errors_truncated'] = True
+
+
+def _create_jobs(employer, chunk, summary):
+    # Near-duplicates are still imported but linked to the original, as in
+    # JobListCreateAPIView; earlier chunks are already in the index
+    jobs = [job for _, job in chunk]
+    for (number, job), duplicate in zip(chunk, find_duplicates(employer, jobs)):
+        if duplicate:
+            job.duplicate_of_id = duplicate[0]
+            if len(summary['duplicates']) < MAX_REPORTED_ERRORS:
+                summary['duplicates'].append({'row': number, 'job_id': duplicate[0], 'similarity': duplicate[2]})
+    with transaction.atomic():
+        if connection.features.can_return_rows_from_bulk_insert:
+            created = Job.objects.bulk_create(jobs)
+        else:
+            # MySQL does not hand back auto-increment ids; read the batch back instead.
+            # Locking the employer's newest job (and, under InnoDB's default
+            # REPEATABLE READ, the index gap after it) holds the employer's
+            # concurrent postings until commit, so the read-back sees only this batch
+            high_water = (
+                Job.objects.select_for_update().filter(employer=employer)
+                .order_by('-pk').values_list('pk', flat=True).first() or 0
+            )
+            Job.objects.bulk_create(jobs)
+            created = list(Job.objects.filter(employer=employer, pk__gt=high_water).order_by('pk'))
+        # bulk_create skips post_save, so the per-job signal work runs here once per chunk
+        index_jobs(created)
+        sync_job_skills(created)
+        store_signatures(created)
+    # Saved-search alerts are sent by the background percolator
+    queue_percolation(job.pk for job in created)
+    return len(jobs)
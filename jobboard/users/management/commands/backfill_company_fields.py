@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from users.company_fields import backfill_company_fields
+from users.models import Job
+
+
+class Command(BaseCommand):
+    help = "Copy company name and logo from each employer's CompanyProfile onto their jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Jobs updated per UPDATE statement.')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        updated = 0
+        last_pk = 0
+        while True:
+            job_ids = list(
+                Job.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size]
+            )
+            if not job_ids:
+                break
+            updated += backfill_company_fields(job_ids)
+            last_pk = job_ids[-1]
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} jobs."))
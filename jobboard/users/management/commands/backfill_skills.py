@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from users.models import Job, JobSeekerProfile
+from users.skills import seed_default_aliases, sync_job_skills, sync_profile_skills
+
+
+class Command(BaseCommand):
+    help = "Seed default skill aliases and build skill tags from existing job and profile skill strings."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows synced per batch.')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        seed_default_aliases()
+
+        for label, queryset, sync in (
+            ('jobs', Job.objects.only('pk', 'skills_required'), sync_job_skills),
+            ('profiles', JobSeekerProfile.objects.only('pk', 'skills'), sync_profile_skills),
+        ):
+            synced = 0
+            batch = []
+            for instance in queryset.order_by('pk').iterator(chunk_size=batch_size):
+                batch.append(instance)
+                if len(batch) >= batch_size:
+                    sync(batch)
+                    synced += len(batch)
+                    batch = []
+            if batch:
+                sync(batch)
+                synced += len(batch)
+            self.stdout.write(f"Synced skill tags for {synced} {label}.")
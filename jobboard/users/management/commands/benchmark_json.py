@@ -0,0 +1,83 @@
+import io
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from users.models import CompanyProfile, Job, Message, User
+from users.renderers import ORJSONParser, ORJSONRenderer
+from users.serializers import JobSerializer, MessageSerializer
+
+DESCRIPTION = (
+    "We are hiring an engineer to build and operate our hiring platform. "
+    "You will design REST APIs, work with Django and MySQL, and mentor the team. "
+) * 8
+
+
+class Command(BaseCommand):
+    help = "Compare DRF's stdlib JSON renderer/parser with the orjson ones on large job-list and conversation payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=1000, help='Rows in the job-list payload.')
+        parser.add_argument('--messages', type=int, default=5000, help='Messages in the conversation payload.')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed runs per measurement.')
+
+    def handle(self, *args, **options):
+        # Built in memory through the real serializers, so no database rows are needed
+        payloads = {
+            'job list': self.job_list(max(1, options['jobs'])),
+            'conversation': self.conversation(max(1, options['messages'])),
+        }
+        repeat = max(1, options['repeat'])
+        for name, data in payloads.items():
+            stdlib_body = JSONRenderer().render(data)
+            orjson_body = ORJSONRenderer().render(data)
+            assert JSONParser().parse(io.BytesIO(stdlib_body)) == ORJSONParser().parse(io.BytesIO(orjson_body))
+
+            self.stdout.write(f"{name}: {len(data)} rows, {len(stdlib_body) / 1024:.0f} KiB")
+            self.report('render', repeat,
+                        lambda: JSONRenderer().render(data),
+                        lambda: ORJSONRenderer().render(data))
+            self.report('parse', repeat,
+                        lambda: JSONParser().parse(io.BytesIO(stdlib_body)),
+                        lambda: ORJSONParser().parse(io.BytesIO(orjson_body)))
+
+    def report(self, label, repeat, stdlib, fast):
+        stdlib_ms = min(timeit.repeat(stdlib, number=1, repeat=repeat)) * 1000
+        fast_ms = min(timeit.repeat(fast, number=1, repeat=repeat)) * 1000
+        self.stdout.write(
+            f"  {label:<6} stdlib {stdlib_ms:8.2f} ms   orjson {fast_ms:8.2f} ms   {stdlib_ms / fast_ms:5.1f}x"
+        )
+
+    def job_list(self, count):
+        now = timezone.now()
+        employer = User(pk=1, username='employer', role='employer')
+        employer.company_profile = CompanyProfile(employer=employer, company_name='Acme Corp')
+        jobs = []
+        for pk in range(1, count + 1):
+            job = Job(
+                pk=pk, employer=employer, title=f'Backend Engineer {pk}', description=DESCRIPTION,
+                skills_required='Python, Django, MySQL, Docker', salary_min=900000, salary_max=1800000,
+                location_city='Bengaluru', location_state='Karnataka', job_type='Full-Time',
+                application_deadline=now.date(), created_at=now, views=pk * 3,
+            )
+            job.application_total = pk % 40
+            job.applicant_status = None
+            jobs.append(job)
+        return JobSerializer(jobs, many=True).data
+
+    def conversation(self, count):
+        now = timezone.now()
+        alice = User(pk=1, username='alice', full_name='Alice Rao')
+        bob = User(pk=2, username='bob', full_name='Bob Menon')
+        messages = [
+            Message(
+                pk=pk, sender=alice if pk % 2 else bob, recipient=bob if pk % 2 else alice,
+                content=f'Message {pk}: thanks for the update, when can we schedule the interview?',
+                timestamp=now, is_read=pk % 3 == 0,
+            )
+            for pk in range(1, count + 1)
+        ]
+        return MessageSerializer(messages, many=True).data
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from users.recommendations import compute_recommendations
+
+
+class Command(BaseCommand):
+    help = "Precompute the top-N recommended jobs for every job seeker from sparse TF-IDF skill vectors."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-n', type=int, default=20, help='Recommendations stored per job seeker.')
+        parser.add_argument('--chunk-size', type=int, default=500, help='Job seekers scored per matrix product.')
+
+    def handle(self, *args, **options):
+        written = compute_recommendations(limit=max(1, options['top_n']), chunk_size=max(1, options['chunk_size']))
+        self.stdout.write(self.style.SUCCESS(f"Stored {written} recommendations."))
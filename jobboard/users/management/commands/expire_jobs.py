@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from users.expiry import expire_jobs
+
+
+class Command(BaseCommand):
+    help = "Mark active jobs past their application deadline as inactive, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows updated per UPDATE statement.')
+        parser.add_argument(
+            '--every', type=int, default=0,
+            help='Keep running and sweep every N seconds (0 = sweep once and exit).',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        while True:
+            expired = expire_jobs(batch_size=batch_size)
+            self.stdout.write(f"Expired {expired} jobs.")
+            if options['every'] <= 0:
+                break
+            close_old_connections()
+            time.sleep(options['every'])
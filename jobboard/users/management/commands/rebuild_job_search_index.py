@@ -0,0 +1,59 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import Max, Min
+
+from users.models import Job
+from users.search import INDEXED_FIELDS, index_jobs
+
+
+def _init_worker():
+    # Forked workers must not share the parent's database connections
+    django.setup()
+    connections.close_all()
+
+
+def _index_range(start, stop):
+    jobs = Job.objects.filter(pk__gte=start, pk__lt=stop).only('pk', *INDEXED_FIELDS)
+    jobs = list(jobs)
+    index_jobs(jobs)
+    return len(jobs)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the inverted search index for all jobs, in parallel batches of primary keys."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Number of worker processes (1 = run inline).')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Primary-key range handled per batch.')
+
+    def handle(self, *args, **options):
+        workers = max(1, options['workers'])
+        batch_size = max(1, options['batch_size'])
+
+        bounds = Job.objects.aggregate(first=Min('pk'), last=Max('pk'))
+        if bounds['first'] is None:
+            self.stdout.write("No jobs to index.")
+            return
+
+        ranges = [
+            (start, start + batch_size)
+            for start in range(bounds['first'], bounds['last'] + 1, batch_size)
+        ]
+
+        indexed = 0
+        if workers == 1:
+            for start, stop in ranges:
+                indexed += _index_range(start, stop)
+        else:
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                futures = [executor.submit(_index_range, start, stop) for start, stop in ranges]
+                for future in as_completed(futures):
+                    indexed += future.result()
+
+        cache.delete('job_search:stats')
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} jobs in {len(ranges)} batches."))
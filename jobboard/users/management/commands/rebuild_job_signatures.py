@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from users.dedupe import store_signatures
+from users.models import Job
+
+
+class Command(BaseCommand):
+    help = "Compute MinHash signatures for all jobs (used by near-duplicate detection)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Jobs signed per batch.')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        signed = 0
+        batch = []
+        for job in Job.objects.only('pk', 'title', 'description').order_by('pk').iterator(chunk_size=batch_size):
+            batch.append(job)
+            if len(batch) >= batch_size:
+                store_signatures(batch)
+                signed += len(batch)
+                batch = []
+        if batch:
+            store_signatures(batch)
+            signed += len(batch)
+        self.stdout.write(self.style.SUCCESS(f"Signed {signed} jobs."))
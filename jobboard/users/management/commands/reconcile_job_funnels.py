@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from users.funnel import reconcile_funnels
+
+
+class Command(BaseCommand):
+    help = "Recount every job's hiring funnel from its applications and fix drifted rollup rows (run daily)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Jobs recounted per GROUP BY query.')
+
+    def handle(self, *args, **options):
+        checked, corrected = reconcile_funnels(batch_size=max(1, options['batch_size']))
+        self.stdout.write(self.style.SUCCESS(f"Checked {checked} jobs, corrected {corrected} funnels."))
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:03
+
+import re
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of the users.search tokenizer and field weights at this migration
+FIELD_WEIGHTS = {'title': 3, 'skills_required': 2, 'description': 1}
+MAX_TERM_LENGTH = 64
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it of on or that the this to was were will with
+""".split())
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def tokenize(text):
+    if not text:
+        return []
+    return [
+        token for token in TOKEN_RE.findall(text.lower())
+        if token not in STOP_WORDS and len(token) <= MAX_TERM_LENGTH
+    ]
+
+
+def index_existing_jobs(apps, schema_editor):
+    # Without postings every keyword search finds nothing, so index the existing jobs here
+    Job = apps.get_model('users', 'Job')
+    JobSearchDocument = apps.get_model('users', 'JobSearchDocument')
+    JobSearchTerm = apps.get_model('users', 'JobSearchTerm')
+    last_pk = 0
+    while True:
+        jobs = list(Job.objects.filter(pk__gt=last_pk).order_by('pk').only('pk', *FIELD_WEIGHTS)[:1000])
+        if not jobs:
+            break
+        last_pk = jobs[-1].pk
+        documents, postings = [], []
+        for job in jobs:
+            frequencies = Counter()
+            for field, weight in FIELD_WEIGHTS.items():
+                for token in tokenize(getattr(job, field)):
+                    frequencies[token] += weight
+            documents.append(JobSearchDocument(job_id=job.pk, length=sum(frequencies.values())))
+            postings.extend(
+                JobSearchTerm(job_id=job.pk, term=term, frequency=frequency)
+                for term, frequency in frequencies.items()
+            )
+        JobSearchDocument.objects.bulk_create(documents)
+        JobSearchTerm.objects.bulk_create(postings, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0017_job_job_description_pdf_alter_job_description'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSearchDocument',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='users.job')),
+                ('length', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('frequency', models.PositiveIntegerField(default=1)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='users.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'job'], name='job_search_term_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'term'), name='unique_job_search_term')],
+            },
+        ),
+        migrations.RunPython(index_existing_jobs, migrations.RunPython.noop),
+    ]
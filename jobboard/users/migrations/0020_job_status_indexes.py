@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0019_job_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='job_status_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'application_deadline'], name='job_status_deadline_idx'),
+        ),
+    ]
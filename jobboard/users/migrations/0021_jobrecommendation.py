@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0020_job_status_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='users.job')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_recommendations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-score'], name='job_recommendation_user_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'job'), name='unique_job_recommendation')],
+            },
+        ),
+    ]
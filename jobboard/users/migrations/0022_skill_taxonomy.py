@@ -0,0 +1,121 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:10
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copies of the users.skills parser and default aliases at this migration
+SKILL_SEPARATORS = re.compile(r"[,;\n|]+")
+DEFAULT_SKILL_ALIASES = {
+    'js': 'JavaScript',
+    'javascript es6': 'JavaScript',
+    'ts': 'TypeScript',
+    'py': 'Python',
+    'python3': 'Python',
+    'golang': 'Go',
+    'k8s': 'Kubernetes',
+    'postgres': 'PostgreSQL',
+    'postgresql db': 'PostgreSQL',
+    'reactjs': 'React',
+    'react.js': 'React',
+    'node': 'Node.js',
+    'nodejs': 'Node.js',
+    'vuejs': 'Vue.js',
+    'ml': 'Machine Learning',
+    'ai': 'Artificial Intelligence',
+    'c sharp': 'C#',
+    'cpp': 'C++',
+    'aws': 'Amazon Web Services',
+    'gcp': 'Google Cloud Platform',
+}
+
+
+def normalize_skill(name):
+    return ' '.join(name.split()).lower()
+
+
+def parse_skills(text):
+    skills = {}
+    for raw in SKILL_SEPARATORS.split(text or ''):
+        display = ' '.join(raw.split())
+        if display:
+            skills.setdefault(normalize_skill(display)[:100], display[:100])
+    return skills
+
+
+def tag_existing_skills(apps, schema_editor):
+    # Seed the default aliases and tag the existing jobs and profiles, so skill
+    # filters and applicant ranking cover them from the first request
+    Skill = apps.get_model('users', 'Skill')
+    SkillAlias = apps.get_model('users', 'SkillAlias')
+    canonical = {normalize_skill(name): name for name in DEFAULT_SKILL_ALIASES.values()}
+    Skill.objects.bulk_create([Skill(name=name, normalized_name=key) for key, name in canonical.items()])
+    skill_ids = dict(Skill.objects.values_list('normalized_name', 'pk'))
+    aliases = {alias: skill_ids[normalize_skill(name)] for alias, name in DEFAULT_SKILL_ALIASES.items()}
+    SkillAlias.objects.bulk_create([SkillAlias(alias=alias, skill_id=skill_id) for alias, skill_id in aliases.items()])
+
+    for model_name, field in (('Job', 'skills_required'), ('JobSeekerProfile', 'skills')):
+        model = apps.get_model('users', model_name)
+        through = model.skill_tags.through
+        owner_field = f'{model._meta.model_name}_id'
+        last_pk = 0
+        while True:
+            rows = list(model.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', field)[:500])
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+            parsed = {pk: parse_skills(text) for pk, text in rows}
+            new = {
+                key: display
+                for skills in parsed.values() for key, display in skills.items()
+                if key not in aliases and key not in skill_ids
+            }
+            if new:
+                Skill.objects.bulk_create([Skill(name=display, normalized_name=key) for key, display in new.items()])
+                skill_ids.update(Skill.objects.filter(normalized_name__in=list(new)).values_list('normalized_name', 'pk'))
+            tags = {(pk, aliases.get(key) or skill_ids[key]) for pk, skills in parsed.items() for key in skills}
+            through.objects.bulk_create(
+                [through(**{owner_field: pk, 'skill_id': skill_id}) for pk, skill_id in tags],
+                batch_size=1000,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0021_jobrecommendation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('normalized_name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, related_name='jobs', to='users.skill'),
+        ),
+        migrations.AddField(
+            model_name='jobseekerprofile',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, related_name='seekers', to='users.skill'),
+        ),
+        migrations.CreateModel(
+            name='SkillAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=100, unique=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='users.skill')),
+            ],
+            options={
+                'verbose_name_plural': 'skill aliases',
+            },
+        ),
+        migrations.RunPython(tag_existing_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0022_skill_taxonomy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSignature',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='users.job')),
+                ('signature', models.BinaryField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='users.job'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0023_job_duplicate_detection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('keyword', models.CharField(blank=True, max_length=200)),
+                ('location', models.CharField(blank=True, max_length=100)),
+                ('job_type', models.CharField(blank=True, choices=[('Full-Time', 'Full-Time'), ('Part-Time', 'Part-Time'), ('Internship', 'Internship'), ('Remote', 'Remote')], max_length=50)),
+                ('min_salary', models.PositiveIntegerField(blank=True, null=True)),
+                ('has_terms', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SavedSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('saved_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='users.savedsearch')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=models.Index(fields=['has_terms', 'job_type'], name='savedsearch_percolate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearchterm',
+            index=models.Index(fields=['term', 'saved_search'], name='savedsearch_term_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='savedsearchterm',
+            constraint=models.UniqueConstraint(fields=('saved_search', 'term'), name='unique_saved_search_term'),
+        ),
+    ]
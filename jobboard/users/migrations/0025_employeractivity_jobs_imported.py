@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0024_saved_searches'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='employeractivity',
+            name='activity_type',
+            field=models.CharField(choices=[('job_posted', 'Job Posted'), ('job_edited', 'Job Edited'), ('job_deleted', 'Job Deleted'), ('company_updated', 'Company Info Updated'), ('application_viewed', 'Viewed Applications'), ('jobs_imported', 'Jobs Imported')], max_length=50),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:22
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def copy_company_fields(apps, schema_editor):
+    # Fill the new columns from each employer's CompanyProfile so existing jobs
+    # show their company straight away, one UPDATE per batch of jobs
+    Job = apps.get_model('users', 'Job')
+    CompanyProfile = apps.get_model('users', 'CompanyProfile')
+    profiles = CompanyProfile.objects.filter(employer_id=OuterRef('employer_id'))
+    last_pk = 0
+    while True:
+        job_ids = list(Job.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:1000])
+        if not job_ids:
+            break
+        last_pk = job_ids[-1]
+        Job.objects.filter(pk__in=job_ids).update(
+            company_name=Coalesce(Subquery(profiles.values('company_name')[:1]), Value('')),
+            company_logo=Coalesce(Subquery(profiles.values('logo')[:1]), Value('')),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0026_employeractivity_jobs_bulk_updated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='company_logo',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='company_name',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.RunPython(copy_company_fields, migrations.RunPython.noop),
+    ]
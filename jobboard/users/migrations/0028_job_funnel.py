@@ -0,0 +1,50 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:26
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+# Frozen copy of JobApplication's statuses at this migration
+FUNNEL_STATUSES = ['applied', 'under_review', 'shortlisted', 'rejected', 'hired']
+
+
+def backfill_funnels(apps, schema_editor):
+    # Count the existing applications so funnels are right from the first request
+    JobApplication = apps.get_model('users', 'JobApplication')
+    JobFunnel = apps.get_model('users', 'JobFunnel')
+    counts = defaultdict(dict)
+    for job_id, status, total in (
+        JobApplication.objects.filter(status__in=FUNNEL_STATUSES)
+        .values_list('job_id', 'status').annotate(total=Count('pk')).order_by()
+    ):
+        counts[job_id][status] = total
+    # The table was created above, so plain inserts suffice
+    JobFunnel.objects.bulk_create(
+        [JobFunnel(job_id=job_id, **statuses) for job_id, statuses in counts.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0027_job_company_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobFunnel',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='funnel', serialize=False, to='users.job')),
+                ('applied', models.IntegerField(default=0)),
+                ('under_review', models.IntegerField(default=0)),
+                ('shortlisted', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+                ('hired', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_funnels, migrations.RunPython.noop),
+    ]
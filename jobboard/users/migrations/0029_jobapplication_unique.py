@@ -0,0 +1,53 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:27
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+# Frozen copy of JobApplication's statuses at this migration
+FUNNEL_STATUSES = ['applied', 'under_review', 'shortlisted', 'rejected', 'hired']
+
+
+def remove_duplicate_applications(apps, schema_editor):
+    # Keep the earliest application of each (user, job) pair so the constraint can be added
+    JobApplication = apps.get_model('users', 'JobApplication')
+    JobFunnel = apps.get_model('users', 'JobFunnel')
+    keep = (
+        JobApplication.objects.values('user_id', 'job_id')
+        .annotate(first_id=Min('id'))
+        .values_list('first_id', flat=True)
+    )
+    duplicates = JobApplication.objects.exclude(id__in=list(keep))
+    job_ids = set(duplicates.values_list('job_id', flat=True))
+    if not job_ids:
+        return
+    duplicates.delete()
+
+    # Historical models send no signals, so recount the affected funnels
+    counts = defaultdict(dict)
+    for job_id, status, total in (
+        JobApplication.objects.filter(job_id__in=job_ids, status__in=FUNNEL_STATUSES)
+        .values_list('job_id', 'status').annotate(total=Count('pk')).order_by()
+    ):
+        counts[job_id][status] = total
+    JobFunnel.objects.filter(job_id__in=job_ids).delete()
+    JobFunnel.objects.bulk_create(
+        [JobFunnel(job_id=job_id, **statuses) for job_id, statuses in counts.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0028_job_funnel'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_applications, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='jobapplication',
+            constraint=models.UniqueConstraint(fields=('user', 'job'), name='unique_job_application'),
+        ),
+    ]
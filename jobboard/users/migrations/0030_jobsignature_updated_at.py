@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0029_jobapplication_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobsignature',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -69,6 +69,23 @@ class Job(models.Model):
     ]
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='active')
     views = models.PositiveIntegerField(default=0)
+    # Normalized form of skills_required, kept in sync by users.signals
+    skill_tags = models.ManyToManyField('Skill', related_name='jobs', blank=True)
+    # Set when the posting was detected as a near-duplicate of an earlier one (users.dedupe)
+    duplicate_of = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='duplicates')
+    # Copied from the employer's CompanyProfile (users.company_fields) so listings need no joins
+    company_name = models.CharField(max_length=255, blank=True)
+    company_logo = models.CharField(max_length=100, blank=True)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination seeks on (created_at, id), optionally per employer
+            models.Index(fields=['-created_at', '-id'], name='job_created_keyset_idx'),
+            models.Index(fields=['employer', '-created_at', '-id'], name='job_employer_keyset_idx'),
+            # "Active only" listings and the expiry sweeper
+            models.Index(fields=['status', '-created_at', '-id'], name='job_status_keyset_idx'),
+            models.Index(fields=['status', 'application_deadline'], name='job_status_deadline_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -108,6 +125,12 @@ class JobApplication(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='applied')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            # One application per seeker per job, enforced by the insert itself
+            models.UniqueConstraint(fields=['user', 'job'], name='unique_job_application'),
+        ]
+
     def __str__(self):
         return f"{self.user.username} -> {self.job.title}"
     
@@ -145,6 +168,8 @@ class EmployerActivity(models.Model):
         ('job_deleted', 'Job Deleted'),
         ('company_updated', 'Company Info Updated'),
         ('application_viewed', 'Viewed Applications'),
+        ('jobs_imported', 'Jobs Imported'),
+        ('jobs_bulk_updated', 'Jobs Bulk Updated'),
     ]
 
     employer = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -165,6 +190,8 @@ class JobSeekerProfile(models.Model):
     skills = models.TextField(blank=True)
     experience = models.TextField(blank=True)
     portfolio_url = models.URLField(blank=True)
+    # Normalized form of skills, kept in sync by users.signals
+    skill_tags = models.ManyToManyField('Skill', related_name='seekers', blank=True)
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
@@ -206,3 +233,134 @@ class Notification(models.Model):
 
 
 
+
+
+class JobSearchDocument(models.Model):
+    # One row per indexed job; `length` is the weighted token count BM25 needs
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='search_document')
+    length = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"Search document for job {self.job_id}"
+
+
+class JobSearchTerm(models.Model):
+    # Inverted index posting: term -> job with its weighted term frequency
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='search_terms')
+    term = models.CharField(max_length=64)
+    frequency = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'term'], name='unique_job_search_term'),
+        ]
+        indexes = [
+            models.Index(fields=['term', 'job'], name='job_search_term_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.term} -> job {self.job_id}"
+
+
+class JobRecommendation(models.Model):
+    # Precomputed top-N matches per job seeker, refreshed by `compute_recommendations`
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='job_recommendations')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='recommendations')
+    score = models.FloatField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'job'], name='unique_job_recommendation'),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-score'], name='job_recommendation_user_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} -> {self.job.title} ({self.score:.3f})"
+
+
+class Skill(models.Model):
+    name = models.CharField(max_length=100)
+    # Lower-cased, whitespace-collapsed name used for lookups
+    normalized_name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class SkillAlias(models.Model):
+    # Synonyms resolved to their canonical skill at write and query time, e.g. "js" -> JavaScript
+    alias = models.CharField(max_length=100, unique=True)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='aliases')
+
+    class Meta:
+        verbose_name_plural = 'skill aliases'
+
+    def __str__(self):
+        return f"{self.alias} -> {self.skill.name}"
+
+
+class JobSignature(models.Model):
+    # MinHash signature of a job's title + description, used for near-duplicate detection
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='signature')
+    signature = models.BinaryField()
+    # Lets every process's in-memory LSH index pick up edited signatures
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    def __str__(self):
+        return f"Signature for job {self.job_id}"
+
+
+class SavedSearch(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_searches')
+    name = models.CharField(max_length=100)
+    keyword = models.CharField(max_length=200, blank=True)
+    location = models.CharField(max_length=100, blank=True)
+    job_type = models.CharField(max_length=50, choices=Job.JOB_TYPE_CHOICES, blank=True)
+    min_salary = models.PositiveIntegerField(null=True, blank=True)
+    # False when the keyword has no indexable terms, so the search matches on filters alone
+    has_terms = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['has_terms', 'job_type'], name='savedsearch_percolate_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.user.username})"
+
+
+class SavedSearchTerm(models.Model):
+    # Reverse index of saved keywords: a new job is matched only against the
+    # searches that share at least one of its terms
+    saved_search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='terms')
+    term = models.CharField(max_length=64)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['saved_search', 'term'], name='unique_saved_search_term'),
+        ]
+        indexes = [
+            models.Index(fields=['term', 'saved_search'], name='savedsearch_term_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.term} -> {self.saved_search_id}"
+
+
+class JobFunnel(models.Model):
+    # Application counts per status, maintained incrementally (users.funnel) and
+    # reconciled daily by `manage.py reconcile_job_funnels`
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='funnel')
+    applied = models.IntegerField(default=0)
+    under_review = models.IntegerField(default=0)
+    shortlisted = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+    hired = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Funnel for job {self.job_id}"
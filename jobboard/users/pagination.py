@@ -0,0 +1,154 @@
+import base64
+import json
+from datetime import date, datetime
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque-cursor keyset pagination.
+
+    The page boundary is encoded as the ordering values of the first/last row,
+    so every page is fetched with an indexed `WHERE (created_at, id) < (...)`
+    seek instead of an OFFSET scan. The ordering is taken from the queryset
+    (e.g. `-search_rank, -created_at`) and always ends with the primary key so
+    the cursor is unique.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    default_ordering = ('-created_at', '-id')
+    invalid_cursor_message = 'Invalid cursor'
+    include_count = False
+
+    def __init__(self):
+        self.page_size = getattr(settings, 'JOB_LIST_PAGE_SIZE', 20)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(queryset)
+        self.count = queryset.count() if self.include_count else None
+        page_size = self.get_page_size(request)
+        values, reverse = self.decode_cursor(request)
+
+        if reverse:
+            queryset = queryset.order_by(*[self._flip(field) for field in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if values is not None:
+            queryset = queryset.filter(self._seek(values, reverse))
+
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = values is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = values is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        payload = {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+        if self.include_count:
+            payload['count'] = self.count
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        properties = {
+            'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+            'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+            'results': schema,
+        }
+        if self.include_count:
+            properties['count'] = {'type': 'integer'}
+        return {'type': 'object', 'required': ['results'], 'properties': properties}
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset):
+        ordering = [field for field in queryset.query.order_by if isinstance(field, str)]
+        if not ordering:
+            return list(self.default_ordering)
+        if not any(field.lstrip('-') in ('id', 'pk') for field in ordering):
+            ordering.append('-id' if ordering[-1].startswith('-') else 'id')
+        return ordering
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            values, reverse = payload['v'], bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def encode_cursor(self, values, reverse):
+        # Full-precision isoformat: DjangoJSONEncoder would truncate datetimes to milliseconds
+        values = [value.isoformat() if isinstance(value, (datetime, date)) else value for value in values]
+        payload = json.dumps({'v': values, 'r': reverse}, cls=DjangoJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+    def _link(self, obj, reverse):
+        values = [getattr(obj, field.lstrip('-')) for field in self.ordering]
+        cursor = self.encode_cursor(values, reverse)
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def _seek(self, values, reverse):
+        # Lexicographic "row comes after the cursor" predicate:
+        # (a < x) OR (a = x AND b < y) OR (a = x AND b = y AND c < z) ...
+        condition = Q()
+        equal = {}
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip('-')
+            descending = field.startswith('-')
+            lookup = 'lt' if descending != reverse else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        return condition
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+
+class CountedKeysetPagination(KeysetPagination):
+    # Adds the total match count (one COUNT per request) for search result headers
+    include_count = True
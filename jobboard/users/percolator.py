@@ -0,0 +1,165 @@
+import atexit
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q, Value
+from django.db.models.lookups import IContains
+
+from .buffers import BackgroundBuffer
+from .models import Job, Notification, SavedSearch, SavedSearchTerm
+from .search import INDEXED_FIELDS, build_postings, tokenize
+
+
+def index_saved_search(saved_search):
+    """Rebuild the reverse-index rows of one saved search from its keyword."""
+    terms = set(tokenize(saved_search.keyword))
+    with transaction.atomic():
+        SavedSearchTerm.objects.filter(saved_search=saved_search).delete()
+        SavedSearchTerm.objects.bulk_create(
+            [SavedSearchTerm(saved_search=saved_search, term=term) for term in terms]
+        )
+        if saved_search.has_terms != bool(terms):
+            saved_search.has_terms = bool(terms)
+            SavedSearch.objects.filter(pk=saved_search.pk).update(has_terms=saved_search.has_terms)
+
+
+def location_filter(city, state):
+    """
+    Saved searches whose location is empty or contained in `city` or `state`
+    (case-insensitive). The stored location is the LIKE pattern here; Django
+    escapes %, _ and the escape character in expression patterns, so they
+    only ever match literally.
+    """
+    return (
+        Q(location='')
+        | IContains(Value(city or ''), F('location'))
+        | IContains(Value(state or ''), F('location'))
+    )
+
+
+def matching_searches(job):
+    """
+    Saved searches a job satisfies, using the same semantics as the job search:
+    any keyword term, a location contained in the city or state, the exact job
+    type and a salary floor. Only searches sharing a term with the job (or with
+    no terms at all) are considered; the remaining filters run in the same query.
+    """
+    postings, _ = build_postings(job)
+    by_terms = Q(has_terms=False)
+    if postings:
+        by_terms |= Q(pk__in=SavedSearchTerm.objects.filter(term__in=list(postings)).values('saved_search'))
+
+    by_location = location_filter(job.location_city, job.location_state)
+    by_salary = Q(min_salary__isnull=True)
+    if job.salary_min is not None:
+        by_salary |= Q(min_salary__lte=job.salary_min)
+
+    return (
+        SavedSearch.objects.filter(by_terms, by_location, by_salary)
+        .filter(Q(job_type='') | Q(job_type=job.job_type))
+        .exclude(user_id=job.employer_id)
+    )
+
+
+def batch_matches(jobs):
+    """
+    Yield (job, search) pairs for many jobs. Jobs are grouped by job type and
+    location; per group, one query returns the term-index rows of the searches
+    that share a term with the group's jobs and a second the searches without
+    terms, with the location, job type and employer filters applied in SQL.
+    Only the salary floor and which job owns a matched term are checked here,
+    over rows that already matched.
+    """
+    groups = defaultdict(list)
+    for job in jobs:
+        groups[(job.job_type, job.location_city or '', job.location_state or '', job.employer_id)].append(job)
+
+    fields = ('pk', 'user_id', 'name', 'min_salary')
+    for (job_type, city, state, employer_id), group in groups.items():
+        searches = (
+            SavedSearch.objects.filter(location_filter(city, state))
+            .filter(Q(job_type='') | Q(job_type=job_type))
+            .exclude(user_id=employer_id)
+        )
+        postings = {job.pk: set(build_postings(job)[0]) for job in group}
+        by_term = defaultdict(list)
+        rows = SavedSearchTerm.objects.filter(
+            term__in=set().union(*postings.values()),
+            saved_search__in=searches.filter(has_terms=True),
+        ).values_list('term', *(f'saved_search__{field}' for field in fields))
+        for term, *values in rows:
+            by_term[term].append(dict(zip(fields, values)))
+        without_terms = list(searches.filter(has_terms=False).values(*fields))
+
+        for job in group:
+            matched = {search['pk']: search for term in postings[job.pk] for search in by_term.get(term, ())}
+            matched.update((search['pk'], search) for search in without_terms)
+            for search in matched.values():
+                if search['min_salary'] is None or (job.salary_min is not None and job.salary_min >= search['min_salary']):
+                    yield job, search
+
+
+def percolate_jobs(jobs):
+    """Notify the owners of every saved search matched by `jobs`; returns the count."""
+    jobs = [job for job in jobs if job.status == 'active']
+    if len(jobs) == 1:
+        job = jobs[0]
+        matches = (
+            (job, search)
+            for search in matching_searches(job).values('pk', 'user_id', 'name')
+        )
+    else:
+        matches = batch_matches(jobs) if jobs else ()
+
+    notifications = [
+        Notification(
+            user_id=search['user_id'],
+            message=f"New job matching your saved search '{search['name']}': {job.title}"[:255],
+            link=f"/job/{job.pk}",
+        )
+        for job, search in matches
+    ]
+    Notification.objects.bulk_create(notifications, batch_size=1000)
+    return len(notifications)
+
+
+class PercolationQueue(BackgroundBuffer):
+    """
+    Per-process queue of new job ids whose saved-search alerts are still to be
+    sent, so percolation stays off the request that saved the job.
+
+    A background thread percolates the queued jobs in one batch every
+    `flush_interval` seconds; with an interval of 0 they are percolated
+    immediately.
+    """
+
+    thread_name = 'saved-search-percolator'
+
+    def empty(self):
+        return set()
+
+    def add(self, pending, job_ids):
+        pending.update(job_ids)
+
+    def split(self, pending):
+        return [{job_id} for job_id in pending]
+
+    def write(self, pending):
+        jobs = list(
+            Job.objects.filter(pk__in=pending).only(
+                'pk', 'employer_id', 'status', 'job_type', 'location_city', 'location_state',
+                'salary_min', *INDEXED_FIELDS,
+            )
+        )
+        return percolate_jobs(jobs)
+
+
+percolation_queue = PercolationQueue(getattr(settings, 'SAVED_SEARCH_PERCOLATE_INTERVAL', 10))
+atexit.register(percolation_queue.flush)
+
+
+def queue_percolation(job_ids):
+    """Percolate the jobs once the current transaction commits (immediately outside one)."""
+    job_ids = list(job_ids)
+    transaction.on_commit(lambda: percolation_queue.record(job_ids))
@@ -0,0 +1,118 @@
+from datetime import date
+
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from rest_framework import serializers
+
+from .models import Job, JobApplication
+from .search import rank_jobs
+from .serializers import JobQuerySerializer
+from .skills import matching_skill_ids
+
+
+def location_filter(location):
+    return Q(location_city__icontains=location) | Q(location_state__icontains=location)
+
+
+def active_filter():
+    # `status` is kept current by the expiry sweeper; the deadline check only
+    # covers jobs that lapsed since its last run
+    return Q(status='active') & (
+        Q(application_deadline__isnull=True) | Q(application_deadline__gte=date.today())
+    )
+
+
+def salary_filter(min_salary, max_salary=None):
+    if max_salary is None:
+        return Q(salary_min__gte=min_salary)
+    return Q(salary_min__gte=min_salary, salary_max__lte=max_salary)
+
+
+def filter_by_skills(queryset, names):
+    # Each name resolves to its skill ids through the aliases ("JS" -> JavaScript),
+    # then becomes an indexed semi-join on the job/skill relation instead of a substring match
+    skill_ids = matching_skill_ids(names)
+    if not skill_ids or not all(skill_ids.values()):
+        return queryset.none()
+    through = Job.skill_tags.through
+    for ids in {frozenset(ids) for ids in skill_ids.values()}:
+        queryset = queryset.filter(pk__in=through.objects.filter(skill_id__in=ids).values('job_id'))
+    return queryset
+
+
+def with_application_stats(queryset, user=None):
+    """
+    Annotate the per-job application total and, for job seekers, their own
+    application status, as correlated subqueries in the same SELECT.
+    """
+    totals = (
+        JobApplication.objects.filter(job=OuterRef('pk'))
+        .order_by().values('job').annotate(total=Count('pk')).values('total')
+    )
+    queryset = queryset.annotate(
+        application_total=Coalesce(Subquery(totals, output_field=IntegerField()), Value(0))
+    )
+    if user is not None and user.is_authenticated and user.role == 'job_seeker':
+        statuses = JobApplication.objects.filter(job=OuterRef('pk'), user=user).values('status')[:1]
+        queryset = queryset.annotate(applicant_status=Subquery(statuses))
+    return queryset
+
+
+def build_job_query(filters, user=None, queryset=None):
+    """Turn validated JobQuerySerializer data into one ordered Job queryset."""
+    if queryset is None:
+        queryset = Job.objects.all()
+
+    conditions = Q()
+    if filters.get('active'):
+        conditions &= active_filter()
+    if filters.get('location'):
+        conditions &= location_filter(filters['location'])
+    if filters.get('job_type'):
+        conditions &= Q(job_type=filters['job_type'])
+    if filters.get('salary'):
+        conditions &= salary_filter(*filters['salary'])
+    queryset = queryset.filter(conditions)
+
+    if filters.get('skills'):
+        queryset = filter_by_skills(queryset, filters['skills'])
+
+    if filters.get('keyword'):
+        queryset = rank_jobs(queryset, filters['keyword'])
+
+    queryset = with_application_stats(queryset, user)
+
+    if 'search_rank' in queryset.query.annotations:
+        return queryset.order_by('-search_rank', '-created_at')
+    return queryset.order_by('-created_at')
+
+
+def compile_job_query(params, user=None, queryset=None):
+    """
+    Validate request query parameters (keyword, location, job_type, salary) and
+    compile them into a single Job queryset. Raises ValidationError on bad input.
+    """
+    serializer = JobQuerySerializer(data=params)
+    serializer.is_valid(raise_exception=True)
+    return build_job_query(serializer.validated_data, user=user, queryset=queryset)
+
+
+def only_serialized_columns(queryset, serializer):
+    """
+    Restrict a Job queryset to the columns `serializer` actually reads, plus the
+    ordering columns keyset pagination needs. Related rows are joined only for
+    dotted sources (e.g. the company name).
+    """
+    columns = {'id'}
+    relations = set()
+    for field in serializer.fields.values():
+        if isinstance(field, serializers.SerializerMethodField) or field.source == '*':
+            continue
+        columns.add('__'.join(field.source_attrs))
+        if len(field.source_attrs) > 1:
+            relations.add('__'.join(field.source_attrs[:-1]))
+    for ordering in queryset.query.order_by:
+        name = ordering.lstrip('-')
+        if name not in queryset.query.annotations:
+            columns.add(name)
+    return queryset.select_related(None).select_related(*relations).only(*columns)
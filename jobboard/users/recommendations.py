@@ -0,0 +1,138 @@
+import math
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+from django.db import transaction
+
+from .models import Job, JobRecommendation, JobSeekerProfile
+from .queries import active_filter
+from .search import tokenize
+
+# A job's listed skills say more about the match than its title or prose
+JOB_FIELD_WEIGHTS = {
+    'skills_required': 3,
+    'title': 2,
+    'description': 1,
+}
+
+
+def job_terms(job):
+    terms = Counter()
+    for field, weight in JOB_FIELD_WEIGHTS.items():
+        for token in tokenize(getattr(job, field, '')):
+            terms[token] += weight
+    return terms
+
+
+def seeker_terms(profile):
+    return Counter(tokenize(profile.skills))
+
+
+class TfidfVectorizer:
+    """Sparse TF-IDF over a fixed vocabulary learned from the job corpus."""
+
+    def fit(self, documents):
+        document_frequency = Counter()
+        for terms in documents:
+            document_frequency.update(terms.keys())
+        vocabulary = sorted(document_frequency)
+        self.vocabulary = {term: column for column, term in enumerate(vocabulary)}
+        total = len(documents)
+        self.idf = np.array(
+            [math.log((1 + total) / (1 + document_frequency[term])) + 1 for term in vocabulary],
+            dtype=np.float64,
+        )
+        return self
+
+    def transform(self, documents):
+        rows, columns, values = [], [], []
+        for row, terms in enumerate(documents):
+            for term, frequency in terms.items():
+                column = self.vocabulary.get(term)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+                    values.append(frequency)
+
+        matrix = sparse.csr_matrix(
+            (np.asarray(values, dtype=np.float64), (rows, columns)),
+            shape=(len(documents), len(self.vocabulary)),
+        )
+        matrix = sparse.csr_matrix(matrix.multiply(self.idf))
+
+        # L2-normalise rows so the dot product is a cosine similarity
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.diags(1.0 / norms) @ matrix
+
+
+class JobMatrix:
+    """TF-IDF matrix (jobs x terms) of every active job."""
+
+    def __init__(self):
+        jobs = list(
+            Job.objects.filter(active_filter())
+            .only('pk', *JOB_FIELD_WEIGHTS)
+            .order_by('pk')
+        )
+        self.job_ids = np.array([job.pk for job in jobs], dtype=np.int64)
+        documents = [job_terms(job) for job in jobs]
+        self.vectorizer = TfidfVectorizer().fit(documents)
+        self.matrix = self.vectorizer.transform(documents).T.tocsr() if jobs else None
+
+    def top_jobs(self, seeker_documents, limit):
+        """
+        Score every active job for each seeker with one sparse product
+        (seekers x terms) @ (terms x jobs) and return [(job_id, score), ...]
+        for each seeker, best first.
+        """
+        if not len(self.job_ids):
+            return [[] for _ in seeker_documents]
+        scores = (self.vectorizer.transform(seeker_documents) @ self.matrix).tocsr()
+
+        results = []
+        for row in range(scores.shape[0]):
+            start, end = scores.indptr[row], scores.indptr[row + 1]
+            columns, values = scores.indices[start:end], scores.data[start:end]
+            if len(values) > limit:
+                best = np.argpartition(-values, limit - 1)[:limit]
+                columns, values = columns[best], values[best]
+            order = np.argsort(-values)
+            results.append([
+                (int(self.job_ids[column]), float(value))
+                for column, value in zip(columns[order], values[order]) if value > 0
+            ])
+        return results
+
+
+def compute_recommendations(limit=20, chunk_size=500):
+    """Rebuild the precomputed top-`limit` job list of every job seeker profile."""
+    job_matrix = JobMatrix()
+    profiles = JobSeekerProfile.objects.exclude(skills='').only('user_id', 'skills').order_by('pk')
+    # Seekers who cleared their skills keep no stale matches
+    JobRecommendation.objects.filter(user__jobseekerprofile__skills='').delete()
+
+    written = 0
+    chunk = []
+    for profile in profiles.iterator(chunk_size=chunk_size):
+        chunk.append(profile)
+        if len(chunk) >= chunk_size:
+            written += _store_chunk(job_matrix, chunk, limit)
+            chunk = []
+    if chunk:
+        written += _store_chunk(job_matrix, chunk, limit)
+    return written
+
+
+def _store_chunk(job_matrix, profiles, limit):
+    ranked = job_matrix.top_jobs([seeker_terms(profile) for profile in profiles], limit)
+    rows = [
+        JobRecommendation(user_id=profile.user_id, job_id=job_id, score=score)
+        for profile, matches in zip(profiles, ranked)
+        for job_id, score in matches
+    ]
+    with transaction.atomic():
+        JobRecommendation.objects.filter(user_id__in=[profile.user_id for profile in profiles]).delete()
+        JobRecommendation.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
@@ -0,0 +1,149 @@
+import math
+import re
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Avg, Case, Count, FloatField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Cast
+
+from .models import JobSearchDocument, JobSearchTerm
+
+# BM25 tuning constants
+K1 = 1.2
+B = 0.75
+
+# Title matches count more than skill matches, which count more than the description
+FIELD_WEIGHTS = {
+    'title': 3,
+    'skills_required': 2,
+    'description': 1,
+}
+INDEXED_FIELDS = tuple(FIELD_WEIGHTS)
+
+MAX_TERM_LENGTH = 64
+STATS_CACHE_TIMEOUT = 300
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it of on or that the this to was were will with
+""".split())
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def tokenize(text):
+    if not text:
+        return []
+    return [
+        token for token in TOKEN_RE.findall(text.lower())
+        if token not in STOP_WORDS and len(token) <= MAX_TERM_LENGTH
+    ]
+
+
+def build_postings(job):
+    """Return ({term: weighted frequency}, document length) for a job."""
+    frequencies = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        for token in tokenize(getattr(job, field, '')):
+            frequencies[token] += weight
+    return frequencies, sum(frequencies.values())
+
+
+def index_jobs(jobs):
+    """(Re)write the postings for an iterable of jobs in bulk."""
+    documents = []
+    postings = []
+    job_ids = []
+    for job in jobs:
+        frequencies, length = build_postings(job)
+        job_ids.append(job.pk)
+        documents.append(JobSearchDocument(job_id=job.pk, length=length))
+        postings.extend(
+            JobSearchTerm(job_id=job.pk, term=term, frequency=frequency)
+            for term, frequency in frequencies.items()
+        )
+
+    if not job_ids:
+        return
+
+    with transaction.atomic():
+        JobSearchTerm.objects.filter(job_id__in=job_ids).delete()
+        JobSearchDocument.objects.filter(job_id__in=job_ids).delete()
+        JobSearchDocument.objects.bulk_create(documents)
+        JobSearchTerm.objects.bulk_create(postings, batch_size=1000)
+
+
+def index_job(job):
+    index_jobs([job])
+
+
+def _corpus_stats():
+    stats = cache.get('job_search:stats')
+    if stats is None:
+        stats = JobSearchDocument.objects.aggregate(total=Count('pk'), avg_length=Avg('length'))
+        stats = {'total': stats['total'], 'avg_length': stats['avg_length'] or 1.0}
+        cache.set('job_search:stats', stats, STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def _document_frequencies(terms):
+    keys = {f'job_search:df:{term}': term for term in terms}
+    cached = cache.get_many(keys)
+    frequencies = {keys[key]: value for key, value in cached.items()}
+
+    missing = [term for term in terms if term not in frequencies]
+    if missing:
+        counted = dict(
+            JobSearchTerm.objects.filter(term__in=missing)
+            .values('term').annotate(df=Count('job')).values_list('term', 'df')
+        )
+        # Unseen terms are not cached so a freshly indexed job becomes searchable immediately
+        cache.set_many({f'job_search:df:{term}': df for term, df in counted.items()}, STATS_CACHE_TIMEOUT)
+        frequencies.update({term: counted.get(term, 0) for term in missing})
+    return frequencies
+
+
+def _idf(total, df):
+    return math.log(1 + (total - df + 0.5) / (df + 0.5))
+
+
+def rank_jobs(queryset, query):
+    """
+    Restrict a Job queryset to postings matching `query` and annotate each row
+    with its BM25 score as `search_rank`. Returns the queryset untouched when the
+    query has no indexable terms.
+    """
+    terms = sorted(set(tokenize(query)))
+    if not terms:
+        return queryset
+
+    stats = _corpus_stats()
+    frequencies = _document_frequencies(terms)
+    weights = {
+        term: _idf(stats['total'], df)
+        for term, df in frequencies.items() if df
+    }
+    if not weights:
+        return queryset.none()
+
+    tf = Cast('frequency', FloatField())
+    length = Cast('job__search_document__length', FloatField())
+    idf = Case(
+        *[When(term=term, then=Value(weight)) for term, weight in weights.items()],
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    score = Sum(
+        idf * tf * Value(K1 + 1) / (tf + Value(K1) * (Value(1 - B) + Value(B) * length / Value(stats['avg_length']))),
+        output_field=FloatField(),
+    )
+    scores = (
+        JobSearchTerm.objects.filter(job=OuterRef('pk'), term__in=list(weights))
+        .values('job')
+        .annotate(score=score)
+        .values('score')
+    )
+    matching = JobSearchTerm.objects.filter(term__in=list(weights)).values('job')
+    return queryset.filter(pk__in=matching).annotate(
+        search_rank=Subquery(scores, output_field=FloatField())
+    )
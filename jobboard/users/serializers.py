@@ -1,14 +1,58 @@
+from datetime import date
+
 from rest_framework import serializers
 from django.db import models
 from .models import (
     User, Job, JobApplication, CompanyProfile, Message, Notification, 
-    EmployerActivity, JobSeekerActivity, JobSeekerProfile
+    EmployerActivity, JobSeekerActivity, JobSeekerProfile, SavedSearch
 )
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth import authenticate
 from django.conf import settings
+from django.urls import reverse
+
+from .file_delivery import file_version, sign_file_path
+from .funnel import funnel_counts
+
+def delivered_file_url(request, view_name, file_name, signed=False, **kwargs):
+    """
+    URL of the endpoint that serves a stored file through users.file_delivery.
+    The storage name is hashed into ?v= so a replaced file gets a new URL and
+    cached copies of the old one are never reused. `signed` URLs also carry a
+    ?sig= that lets the endpoint serve them without credentials.
+    """
+    url = f"{reverse(view_name, kwargs=kwargs)}?v={file_version(file_name)}"
+    if signed:
+        url += f"&sig={sign_file_path(url)}"
+    return request.build_absolute_uri(url) if request else settings.BASE_URL + url
+
+
+class DeliveredFileField(serializers.FileField):
+    # Uploads as usual; renders as the delivery endpoint URL instead of MEDIA_URL
+    def __init__(self, view_name, url_kwarg='pk', lookup_field='pk', signed=False, **kwargs):
+        self.view_name = view_name
+        self.url_kwarg = url_kwarg
+        self.lookup_field = lookup_field
+        self.signed = signed
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        return delivered_file_url(
+            self.context.get('request'), self.view_name, value.name, self.signed,
+            **{self.url_kwarg: getattr(value.instance, self.lookup_field)},
+        )
+
+
+class DeliveredImageField(DeliveredFileField, serializers.ImageField):
+    pass
+
 
 class UserSearchSerializer(serializers.ModelSerializer):
+    # Signed: rendered as <img src>, which cannot send the Bearer token
+    profile_picture = DeliveredImageField('api_profile_picture', signed=True, read_only=True)
+
     class Meta:
         model = User
         fields = ['id', 'username', 'full_name', 'role', 'profile_picture']
@@ -110,12 +154,72 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             raise serializers.ValidationError('Must include username and password.')
 
 
-class JobSerializer(serializers.ModelSerializer):
+def requested_fields(request):
+    # ?fields=id,title,company_name asks GET responses for a sparse fieldset
+    if request is None or request.method != 'GET':
+        return set()
+    raw = request.query_params.get('fields', '')
+    return {name.strip() for name in raw.split(',') if name.strip()}
+
+
+class SparseFieldsMixin:
+    # Drops every field not named in ?fields=; unknown names are ignored
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = requested_fields(self.context.get('request')) & set(self.fields)
+        if requested:
+            for name in set(self.fields) - requested:
+                self.fields.pop(name)
+
+
+class JobListSerializer(serializers.ListSerializer):
+    # Computes application_count / current_status for the whole page in two
+    # queries instead of two per job; JobSerializer reads the attached values.
+    # Querysets built by users.queries already carry them as annotations.
+    def to_representation(self, data):
+        jobs = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        if jobs:
+            self.attach_application_stats(jobs)
+        return super().to_representation(jobs)
+
+    def attach_application_stats(self, jobs):
+        job_ids = [job.pk for job in jobs]
+        fields = self.child.fields
+
+        if 'application_count' in fields and not hasattr(jobs[0], 'application_total'):
+            counts = dict(
+                JobApplication.objects.filter(job_id__in=job_ids)
+                .values('job').annotate(total=models.Count('pk')).values_list('job', 'total')
+            )
+            for job in jobs:
+                job.application_total = counts.get(job.pk, 0)
+
+        request = self.context.get('request')
+        user = getattr(request, 'user', None)
+        if (
+            'current_status' in fields and user and user.is_authenticated
+            and user.role == 'job_seeker' and not hasattr(jobs[0], 'applicant_status')
+        ):
+            statuses = dict(
+                JobApplication.objects.filter(job_id__in=job_ids, user=user).values_list('job_id', 'status')
+            )
+            for job in jobs:
+                job.applicant_status = statuses.get(job.pk)
+
+
+ACTIVE_PAST_DEADLINE_MESSAGE = "An active job cannot have an application deadline in the past."
+
+
+def is_active_past_deadline(status, deadline):
+    # The expiry sweeper (users.expiry) would flip such a job straight back to inactive
+    return status == 'active' and deadline is not None and deadline < date.today()
+
+
+class JobSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     application_deadline = serializers.DateField(required=False, allow_null=True)
-    job_description_pdf = serializers.FileField(required=False, allow_null=True)
+    job_description_pdf = DeliveredFileField('api_job_description_pdf', required=False, allow_null=True)
     current_status = serializers.SerializerMethodField()
     application_count = serializers.SerializerMethodField()
-    company_name = serializers.CharField(source="employer.company_profile.company_name", read_only=True)
 
     class Meta:
         model = Job
@@ -123,11 +227,15 @@ class JobSerializer(serializers.ModelSerializer):
             'id', 'employer', 'title', 'description', 'job_description_pdf',
             'skills_required', 'salary_min', 'salary_max', 'location_city',
             'location_state', 'job_type', 'application_deadline', 'created_at',
-            'status', 'views', 'current_status', 'application_count', 'company_name'
+            'status', 'views', 'current_status', 'application_count', 'company_name',
+            'duplicate_of'
         ]
-        read_only_fields = ['employer', 'current_status', 'application_count', 'company_name']
+        read_only_fields = ['employer', 'current_status', 'application_count', 'company_name', 'duplicate_of']
+        list_serializer_class = JobListSerializer
 
     def get_current_status(self, obj):
+        if hasattr(obj, 'applicant_status'):
+            return obj.applicant_status
         request = self.context.get('request')
         user = getattr(request, 'user', None)
         if user and user.is_authenticated and user.role == 'job_seeker':
@@ -137,11 +245,73 @@ class JobSerializer(serializers.ModelSerializer):
         return None
 
     def get_application_count(self, obj):
+        if hasattr(obj, 'application_total'):
+            return obj.application_total
         return obj.applications.count()
 
+    def validate(self, attrs):
+        # Only checked when the request changes the status or the deadline: the
+        # edit form always resends both, and a lapsed posting the sweeper has
+        # not reached yet must stay editable
+        changed = any(
+            field in attrs and (self.instance is None or attrs[field] != getattr(self.instance, field))
+            for field in ('status', 'application_deadline')
+        )
+        if changed:
+            status = attrs.get('status', getattr(self.instance, 'status', 'active'))
+            deadline = attrs.get('application_deadline', getattr(self.instance, 'application_deadline', None))
+            if is_active_past_deadline(status, deadline):
+                raise serializers.ValidationError({'application_deadline': ACTIVE_PAST_DEADLINE_MESSAGE})
+        return attrs
+
+
+
+class RecommendedJobSerializer(JobSerializer):
+    match_score = serializers.FloatField(read_only=True)
+
+    class Meta(JobSerializer.Meta):
+        fields = JobSerializer.Meta.fields + ['match_score']
+
+
+class EmployerJobListSerializer(JobListSerializer):
+    # Attaches the whole page's funnel rows with one query
+    def attach_application_stats(self, jobs):
+        super().attach_application_stats(jobs)
+        if 'funnel' in self.child.fields:
+            funnels = funnel_counts([job.pk for job in jobs])
+            for job in jobs:
+                job.funnel_counts = funnels[job.pk]
+
+
+class EmployerJobSerializer(JobSerializer):
+    funnel = serializers.SerializerMethodField()
+
+    class Meta(JobSerializer.Meta):
+        fields = JobSerializer.Meta.fields + ['funnel']
+        list_serializer_class = EmployerJobListSerializer
+
+    def get_funnel(self, obj):
+        if hasattr(obj, 'funnel_counts'):
+            return obj.funnel_counts
+        return funnel_counts([obj.pk])[obj.pk]
+
+
+class JobSummarySerializer(JobSerializer):
+    # Compact row for job list pages: no description, PDF or counters
+    class Meta(JobSerializer.Meta):
+        fields = [
+            'id', 'employer', 'title', 'company_name', 'location_city', 'location_state',
+            'job_type', 'salary_min', 'salary_max', 'skills_required',
+            'application_deadline', 'created_at', 'status', 'current_status',
+            'application_count'
+        ]
 
 
 class CompanyProfileSerializer(serializers.ModelSerializer):
+    logo = DeliveredImageField(
+        'api_company_logo', url_kwarg='employer_id', lookup_field='employer_id', required=False, allow_null=True
+    )
+
     class Meta:
         model = CompanyProfile
         fields = '__all__'
@@ -150,15 +320,18 @@ class JobSeekerProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = JobSeekerProfile
         fields = '__all__'
-        read_only_fields = ['user']
+        read_only_fields = ['user', 'skill_tags']
 
 
 
 class JobApplicationSerializer(serializers.ModelSerializer):
     job_id = serializers.IntegerField(source='job.id', read_only=True)
     job_title = serializers.CharField(source='job.title', read_only=True)
-    company_name = serializers.CharField(source='job.employer.company_profile.company_name', read_only=True)
+    company_name = serializers.CharField(source='job.company_name', read_only=True)
     company_logo = serializers.SerializerMethodField()
+    resume = DeliveredFileField(
+        'api_download_resume', url_kwarg='application_id', required=False, allow_null=True
+    )
     
     # ADD THESE LINES to get user details:
     user_id = serializers.IntegerField(source='user.id', read_only=True)
@@ -177,8 +350,11 @@ class JobApplicationSerializer(serializers.ModelSerializer):
                           'user_id', 'user_name', 'user_full_name', 'applicant_name']
 
     def get_company_logo(self, obj):
-        if obj.job.employer.company_profile.logo:
-            return settings.BASE_URL + obj.job.employer.company_profile.logo.url
+        if obj.job.company_logo:
+            return delivered_file_url(
+                self.context.get('request'), 'api_company_logo', obj.job.company_logo,
+                employer_id=obj.job.employer_id,
+            )
         return None
     
     # ADD THIS METHOD:
@@ -193,6 +369,13 @@ class JobApplicationSerializer(serializers.ModelSerializer):
 
 
 
+class RankedJobApplicationSerializer(JobApplicationSerializer):
+    match_score = serializers.FloatField(read_only=True, default=None)
+
+    class Meta(JobApplicationSerializer.Meta):
+        fields = JobApplicationSerializer.Meta.fields + ['match_score']
+
+
 class MessageSerializer(serializers.ModelSerializer):
     sender_name = serializers.SerializerMethodField()
     recipient_name = serializers.SerializerMethodField()
@@ -220,7 +403,10 @@ class ConversationSerializer(serializers.Serializer):
             'id': obj.id,
             'username': obj.username,
             'full_name': obj.full_name or obj.username,
-            'profile_picture': obj.profile_picture.url if obj.profile_picture else None,
+            'profile_picture': delivered_file_url(
+                self.context.get('request'), 'api_profile_picture', obj.profile_picture.name,
+                signed=True, pk=obj.pk,
+            ) if obj.profile_picture else None,
             'role': obj.role
         }
     
@@ -314,4 +500,86 @@ class ChangePasswordSerializer(serializers.Serializer):
     def validate(self, data):
         if data['new_password'] != data['new_password_confirm']:
             raise serializers.ValidationError({"new_password_confirm": "New passwords must match."})
-        return data
\ No newline at end of file
+        return data
+
+class JobQuerySerializer(serializers.Serializer):
+    # Validates the job list/search query parameters consumed by users.queries
+    keyword = serializers.CharField(required=False, allow_blank=True, max_length=200)
+    location = serializers.CharField(required=False, allow_blank=True, max_length=100)
+    job_type = serializers.CharField(required=False, allow_blank=True)
+    salary = serializers.CharField(required=False, allow_blank=True)
+    skills = serializers.CharField(required=False, allow_blank=True, max_length=300)
+    active = serializers.BooleanField(required=False, default=False)
+
+    def validate_job_type(self, value):
+        if not value:
+            return value
+        for choice, _ in Job.JOB_TYPE_CHOICES:
+            if choice.lower() == value.strip().lower():
+                return choice
+        valid = ', '.join(choice for choice, _ in Job.JOB_TYPE_CHOICES)
+        raise serializers.ValidationError(f"Invalid job type. Must be one of: {valid}")
+
+    def validate_skills(self, value):
+        # Comma-separated skill names; every one of them must be required by the job
+        return [skill for skill in (part.strip() for part in value.split(',')) if skill]
+
+    def validate_salary(self, value):
+        # Returns (min, max); max is None for open-ended 'N+' ranges
+        if not value:
+            return None
+        value = value.strip()
+        try:
+            if value.endswith('+'):
+                return int(value[:-1]), None
+            min_salary, max_salary = value.split('-')
+            min_salary, max_salary = int(min_salary), int(max_salary)
+        except (ValueError, TypeError):
+            raise serializers.ValidationError("Salary must be a range like '500000-1000000' or '2000000+'.")
+        if min_salary > max_salary:
+            raise serializers.ValidationError("Minimum salary cannot exceed maximum salary.")
+        return min_salary, max_salary
+
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    job_type = serializers.CharField(required=False, allow_blank=True)
+
+    class Meta:
+        model = SavedSearch
+        fields = ['id', 'name', 'keyword', 'location', 'job_type', 'min_salary', 'created_at']
+        read_only_fields = ['created_at']
+
+    def validate_job_type(self, value):
+        return JobQuerySerializer().validate_job_type(value)
+
+    def validate(self, attrs):
+        keyword = attrs.get('keyword', getattr(self.instance, 'keyword', ''))
+        location = attrs.get('location', getattr(self.instance, 'location', ''))
+        job_type = attrs.get('job_type', getattr(self.instance, 'job_type', ''))
+        min_salary = attrs.get('min_salary', getattr(self.instance, 'min_salary', None))
+        if not (keyword.strip() or location.strip() or job_type or min_salary is not None):
+            raise serializers.ValidationError("A saved search needs at least one filter.")
+        return attrs
+
+
+class JobBulkUpdateSerializer(serializers.Serializer):
+    # Fields a bulk update may change; absent fields are left untouched
+    job_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), min_length=1, max_length=1000)
+    status = serializers.ChoiceField(choices=Job.STATUS_CHOICES, required=False)
+    application_deadline = serializers.DateField(required=False, allow_null=True)
+
+    def validate(self, attrs):
+        if 'status' not in attrs and 'application_deadline' not in attrs:
+            raise serializers.ValidationError("Provide a status and/or an application_deadline to apply.")
+        # Same rule as JobSerializer when both values are given; the view checks
+        # the jobs' stored values when only one of them is
+        if 'status' in attrs and 'application_deadline' in attrs and is_active_past_deadline(
+            attrs['status'], attrs['application_deadline']
+        ):
+            raise serializers.ValidationError({'application_deadline': ACTIVE_PAST_DEADLINE_MESSAGE})
+        return attrs
+
+
+class ApplicationBulkStatusSerializer(serializers.Serializer):
+    application_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), min_length=1, max_length=1000)
+    status = serializers.ChoiceField(choices=JobApplication.STATUS_CHOICES)
@@ -0,0 +1,178 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import request_started
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from .applicant_ranking import invalidate_applicant_ranking, invalidate_applicant_rankings
+from .caching import touch_versions, version_key
+from .models import (
+    CompanyProfile, EmployerActivity, Job, JobApplication, JobSeekerProfile, SavedSearch, SkillAlias, User,
+)
+from .company_fields import company_fields, sync_company_fields
+from .dedupe import job_lsh, store_signatures
+from .funnel import adjust_funnel
+from .percolator import index_saved_search, queue_percolation
+from .search import INDEXED_FIELDS, index_job
+from .skills import ALIAS_CACHE_KEY, sync_job_skills, sync_profile_skills
+
+
+def _touches(update_fields, fields):
+    return update_fields is None or bool(set(update_fields) & set(fields))
+
+
+@receiver(pre_save, sender=Job)
+def fill_company_fields(sender, instance, **kwargs):
+    if instance._state.adding and not instance.company_name:
+        for field, value in company_fields(instance.employer_id).items():
+            setattr(instance, field, value)
+
+
+@receiver(post_save, sender=CompanyProfile)
+def sync_job_company_fields(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, ['company_name', 'logo']):
+        sync_company_fields(instance)
+
+
+@receiver(post_save, sender=Job)
+def reindex_job(sender, instance, update_fields=None, **kwargs):
+    # Skip saves that cannot have changed the indexed text (e.g. status-only updates).
+    # Postings are removed together with the job through the cascading FK.
+    if _touches(update_fields, INDEXED_FIELDS):
+        index_job(instance)
+
+
+@receiver(post_save, sender=Job)
+def sync_job_skill_tags(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, ['skills_required']):
+        sync_job_skills([instance])
+
+
+@receiver(post_save, sender=Job)
+def store_job_signature(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, ['title', 'description']):
+        store_signatures([instance])
+
+
+@receiver(request_started)
+def warm_duplicate_index(sender, **kwargs):
+    # Load the LSH index in the background on a worker's first request, so the
+    # first job POST only has to catch up instead of reading every signature
+    if getattr(settings, 'JOB_DUPLICATE_INDEX_WARM', True):
+        job_lsh.warm()
+
+
+@receiver(post_save, sender=Job)
+def percolate_new_job(sender, instance, created=False, **kwargs):
+    # Alerts go out once, when the posting is created, off the request path
+    if created:
+        queue_percolation([instance.pk])
+
+
+@receiver(post_save, sender=SavedSearch)
+def index_saved_search_terms(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, ['keyword']):
+        index_saved_search(instance)
+
+
+@receiver(post_save, sender=SkillAlias)
+@receiver(post_delete, sender=SkillAlias)
+def clear_skill_alias_cache(sender, **kwargs):
+    # Aliases added in the admin apply to the next search, not after the cache timeout
+    cache.delete(ALIAS_CACHE_KEY)
+
+
+@receiver(post_save, sender=JobSeekerProfile)
+def sync_profile_skill_tags(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, ['skills']):
+        sync_profile_skills([instance])
+
+
+# Incremental hiring-funnel counts (users.funnel)
+
+@receiver(post_init, sender=JobApplication)
+def remember_application_status(sender, instance, **kwargs):
+    # Read from __dict__ so a deferred status is not loaded; unknown transitions
+    # are left to the daily reconciliation
+    instance._funnel_status = instance.__dict__.get('status')
+
+
+@receiver(post_save, sender=JobApplication)
+def count_application_status(sender, instance, created=False, **kwargs):
+    if created:
+        adjust_funnel(instance.job_id, {instance.status: 1})
+    elif instance._funnel_status not in (None, instance.status):
+        adjust_funnel(instance.job_id, {instance._funnel_status: -1, instance.status: 1})
+    instance._funnel_status = instance.status
+
+
+@receiver(post_delete, sender=JobApplication)
+def uncount_application_status(sender, instance, **kwargs):
+    if instance._funnel_status:
+        adjust_funnel(instance.job_id, {instance._funnel_status: -1})
+
+
+# Cached applicant rankings (users.applicant_ranking)
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def invalidate_ranking_for_application(sender, instance, **kwargs):
+    invalidate_applicant_ranking(instance.job_id)
+
+
+@receiver(post_save, sender=Job)
+def invalidate_ranking_for_job(sender, instance, created=False, update_fields=None, **kwargs):
+    if not created and _touches(update_fields, ['title', 'skills_required']):
+        invalidate_applicant_ranking(instance.pk)
+
+
+@receiver(post_save, sender=JobSeekerProfile)
+def invalidate_rankings_for_profile(sender, instance, update_fields=None, **kwargs):
+    # Runs after sync_profile_skill_tags, so the next ranking sees the new tags
+    if _touches(update_fields, ['skills']):
+        job_ids = JobApplication.objects.filter(user_id=instance.user_id).values_list('job_id', flat=True)
+        invalidate_applicant_rankings(list(job_ids))
+
+
+# Version stamps behind the ETag/Last-Modified headers (users.caching.ConditionalGetMixin)
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def touch_job_versions(sender, instance, created=False, **kwargs):
+    keys = [version_key('job', instance.pk), version_key('employer', instance.employer_id)]
+    if created or kwargs.get('signal') is post_delete:
+        keys.append(version_key('site'))
+    touch_versions(*keys)
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def touch_application_versions(sender, instance, created=False, **kwargs):
+    keys = [
+        version_key('job', instance.job_id),
+        version_key('seeker', instance.user_id),
+        version_key('employer', instance.job.employer_id),
+    ]
+    if created or kwargs.get('signal') is post_delete:
+        keys.append(version_key('site'))
+    touch_versions(*keys)
+
+
+@receiver(post_save, sender=CompanyProfile)
+def touch_company_version(sender, instance, **kwargs):
+    # Job bodies embed the company name and logo
+    job_ids = Job.objects.filter(employer_id=instance.employer_id).values_list('pk', flat=True)
+    touch_versions(version_key('company', instance.employer_id), *(version_key('job', job_id) for job_id in job_ids))
+
+
+@receiver(post_save, sender=EmployerActivity)
+def touch_employer_dashboard_version(sender, instance, created=False, **kwargs):
+    if created:
+        touch_versions(version_key('employer', instance.employer_id))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def touch_site_version(sender, instance, created=False, **kwargs):
+    if created or kwargs.get('signal') is post_delete:
+        touch_versions(version_key('site'))
@@ -0,0 +1,159 @@
+import re
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Job, JobSeekerProfile, Skill, SkillAlias
+
+# "/" is part of skill names such as CI/CD, TCP/IP and UI/UX, so it is not a separator
+SKILL_SEPARATORS = re.compile(r"[,;\n|]+")
+ALIAS_CACHE_KEY = 'skills:aliases'
+ALIAS_CACHE_TIMEOUT = 300
+
+# Seeded by `manage.py backfill_skills`; further aliases can be added in the admin
+DEFAULT_SKILL_ALIASES = {
+    'js': 'JavaScript',
+    'javascript es6': 'JavaScript',
+    'ts': 'TypeScript',
+    'py': 'Python',
+    'python3': 'Python',
+    'golang': 'Go',
+    'k8s': 'Kubernetes',
+    'postgres': 'PostgreSQL',
+    'postgresql db': 'PostgreSQL',
+    'reactjs': 'React',
+    'react.js': 'React',
+    'node': 'Node.js',
+    'nodejs': 'Node.js',
+    'vuejs': 'Vue.js',
+    'ml': 'Machine Learning',
+    'ai': 'Artificial Intelligence',
+    'c sharp': 'C#',
+    'cpp': 'C++',
+    'aws': 'Amazon Web Services',
+    'gcp': 'Google Cloud Platform',
+}
+
+
+def normalize_skill(name):
+    return ' '.join(name.split()).lower()
+
+
+def parse_skills(text):
+    """Split a free-text skill list into {normalized name: display name}."""
+    skills = {}
+    for raw in SKILL_SEPARATORS.split(text or ''):
+        display = ' '.join(raw.split())
+        if display:
+            skills.setdefault(normalize_skill(display)[:100], display[:100])
+    return skills
+
+
+def skill_aliases():
+    aliases = cache.get(ALIAS_CACHE_KEY)
+    if aliases is None:
+        aliases = dict(SkillAlias.objects.values_list('alias', 'skill_id'))
+        cache.set(ALIAS_CACHE_KEY, aliases, ALIAS_CACHE_TIMEOUT)
+    return aliases
+
+
+def resolve_skill_ids(names):
+    """
+    Map skill names to Skill ids, applying aliases. Returns
+    {normalized name: id or None} in input order; unknown skills map to None.
+    """
+    keys = [normalize_skill(name) for name in names if name.strip()]
+    aliases = skill_aliases()
+    resolved = {key: aliases.get(key) for key in keys}
+    missing = [key for key, skill_id in resolved.items() if skill_id is None]
+    if missing:
+        resolved.update(Skill.objects.filter(normalized_name__in=missing).values_list('normalized_name', 'pk'))
+    return resolved
+
+
+def matching_skill_ids(names):
+    """
+    Skill ids a skill filter accepts per name: {normalized name: set of ids}.
+    A name matches its alias target, the skill of that exact name and the
+    skills named after any alias of either, so tags written before an alias
+    was added still match. Unknown names map to an empty set.
+    """
+    keys = [normalize_skill(name) for name in names if name.strip()]
+    if not keys:
+        return {}
+    aliases = skill_aliases()
+    aliases_of = {}
+    for alias, skill_id in aliases.items():
+        aliases_of.setdefault(skill_id, []).append(alias)
+
+    named = dict(Skill.objects.filter(normalized_name__in=keys).values_list('normalized_name', 'pk'))
+    targets = {key: {skill_id for skill_id in (aliases.get(key), named.get(key)) if skill_id} for key in keys}
+    # Skills that were created under an alias name before the alias existed
+    alias_names = {alias for ids in targets.values() for skill_id in ids for alias in aliases_of.get(skill_id, ())}
+    alias_names -= set(named)
+    if alias_names:
+        named.update(Skill.objects.filter(normalized_name__in=alias_names).values_list('normalized_name', 'pk'))
+    return {
+        key: ids | {named[alias] for skill_id in ids for alias in aliases_of.get(skill_id, ()) if alias in named}
+        for key, ids in targets.items()
+    }
+
+
+def get_or_create_skill_ids(skills):
+    """Like resolve_skill_ids for a parse_skills() dict, creating unknown skills in bulk."""
+    resolved = resolve_skill_ids(list(skills))
+    missing = [key for key, skill_id in resolved.items() if skill_id is None]
+    if missing:
+        Skill.objects.bulk_create(
+            [Skill(name=skills[key], normalized_name=key) for key in missing],
+            ignore_conflicts=True,
+        )
+        resolved.update(Skill.objects.filter(normalized_name__in=missing).values_list('normalized_name', 'pk'))
+    return resolved
+
+
+def sync_skill_tags(model, source_field, instances):
+    """Rebuild the skill_tags M2M rows of `instances` from their free-text field in bulk."""
+    parsed = {instance.pk: parse_skills(getattr(instance, source_field)) for instance in instances}
+    all_skills = {}
+    for skills in parsed.values():
+        for key, display in skills.items():
+            all_skills.setdefault(key, display)
+    skill_ids = get_or_create_skill_ids(all_skills) if all_skills else {}
+
+    through = model.skill_tags.through
+    owner_field = f'{model._meta.model_name}_id'
+    rows = {
+        (pk, skill_ids[key])
+        for pk, skills in parsed.items()
+        for key in skills
+        if skill_ids.get(key)
+    }
+    with transaction.atomic():
+        through.objects.filter(**{f'{owner_field}__in': list(parsed)}).delete()
+        through.objects.bulk_create(
+            [through(**{owner_field: pk, 'skill_id': skill_id}) for pk, skill_id in rows],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+
+def sync_job_skills(jobs):
+    sync_skill_tags(Job, 'skills_required', jobs)
+
+
+def sync_profile_skills(profiles):
+    sync_skill_tags(JobSeekerProfile, 'skills', profiles)
+
+
+def seed_default_aliases():
+    canonical = {normalize_skill(name): name for name in DEFAULT_SKILL_ALIASES.values()}
+    skill_ids = get_or_create_skill_ids(canonical)
+    SkillAlias.objects.bulk_create(
+        [
+            SkillAlias(alias=alias, skill_id=skill_ids[normalize_skill(name)])
+            for alias, name in DEFAULT_SKILL_ALIASES.items()
+        ],
+        ignore_conflicts=True,
+    )
+    cache.delete(ALIAS_CACHE_KEY)
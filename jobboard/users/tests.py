@@ -1,3 +1,608 @@
-from django.test import TestCase
+import datetime
+import decimal
+import io
+import json
+import shutil
+import tempfile
+from unittest import mock
+from urllib.parse import urlsplit
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from .buffers import BackgroundBuffer
+from .caching import invalidate_job_lists
+from .funnel import funnel_counts, reconcile_funnels
+from .file_delivery import parse_range
+from .models import (
+    CompanyProfile, Job, JobApplication, JobFunnel, Notification, SavedSearch, Skill, SkillAlias, User,
+)
+from .percolator import matching_searches
+from .queries import filter_by_skills
+from .renderers import ORJSONParser, ORJSONRenderer
+from .serializers import JobApplicationSerializer, UserSearchSerializer
+from .skills import parse_skills
+from .view_counts import JobViewBuffer
+
+
+# The repo settings force HTTPS, which the test client does not speak, and warm
+# the duplicate index from a background thread that would race the test transactions
+API_TEST_SETTINGS = {'SECURE_SSL_REDIRECT': False, 'JOB_DUPLICATE_INDEX_WARM': False}
+
+
+def qn(*names):
+    # Identifiers as the test database quotes them ("x" on SQLite/PostgreSQL, `x` on MySQL)
+    return '.'.join(connection.ops.quote_name(name) for name in names)
+
+
+@override_settings(**API_TEST_SETTINGS)
+class JobSearchQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(
+            username='employer', email='employer@example.com', password='pass12345', role='employer'
+        )
+        CompanyProfile.objects.create(
+            employer=cls.employer, company_name='Acme', location_city='Pune',
+            location_state='Maharashtra', contact_email='hr@acme.example.com'
+        )
+        cls.seeker = User.objects.create_user(
+            username='seeker', email='seeker@example.com', password='pass12345', role='job_seeker'
+        )
+        for i in range(12):
+            job = Job.objects.create(
+                employer=cls.employer,
+                title=f'Python Developer {i}' if i % 2 else f'Java Engineer {i}',
+                description='Build and maintain backend services.',
+                skills_required='Python, Django' if i % 2 else 'Java, Spring',
+                salary_min=400000 + i * 100000,
+                salary_max=600000 + i * 100000,
+                location_city='Pune' if i % 3 else 'Mumbai',
+                location_state='Maharashtra',
+                job_type='Remote' if i % 4 == 0 else 'Full-Time',
+            )
+            if i % 5 == 0:
+                JobApplication.objects.create(job=job, user=cls.seeker)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def search(self, query, warm=False):
+        cache.clear()
+        if warm:
+            # Prime the corpus statistics and document frequencies, then drop
+            # only the cached response so the listing itself is measured
+            self.client.get('/api/job-search/', query)
+            invalidate_job_lists()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/job-search/', query)
+        self.assertEqual(response.status_code, 200)
+        return response, [q['sql'] for q in queries.captured_queries]
+
+    def assertListingQueries(self, statements, keyword=False):
+        counts = [sql for sql in statements if sql.startswith('SELECT COUNT(*)')]
+        stats = [sql for sql in statements if 'AVG(' in sql and 'users_jobsearchdocument' in sql]
+        frequencies = [sql for sql in statements if sql.startswith(f"SELECT {qn('users_jobsearchterm', 'term')}")]
+        selects = [sql for sql in statements if sql not in counts + stats + frequencies]
+        self.assertEqual(len(counts), 1, statements)
+        self.assertEqual(len(selects), 1, statements)
+        # A cold keyword search also reads the BM25 corpus statistics and the
+        # document frequency of its terms (one query each), then caches them
+        self.assertEqual(len(stats), int(keyword), statements)
+        self.assertEqual(len(frequencies), int(keyword), statements)
+
+    def test_search_query_counts_cold_and_warm(self):
+        queries = [
+            {},
+            {'keyword': 'python'},
+            {'location': 'pune', 'job_type': 'full-time'},
+            {'keyword': 'python django', 'location': 'Pune', 'job_type': 'Full-Time', 'salary': '500000-2000000'},
+            {'salary': '1000000+', 'page_size': 3},
+        ]
+        for query in queries:
+            for warm in (False, True):
+                with self.subTest(query=query, warm=warm):
+                    response, statements = self.search(query, warm=warm)
+                    self.assertListingQueries(statements, keyword='keyword' in query and not warm)
+                    if not response.data['next']:
+                        self.assertEqual(response.data['count'], len(response.data['results']))
+
+    def test_seeker_search_includes_status_without_extra_queries(self):
+        self.client.force_authenticate(self.seeker)
+        response, statements = self.search({'keyword': 'java'}, warm=True)
+        self.assertListingQueries(statements)
+        statuses = {job['id']: job['current_status'] for job in response.data['results']}
+        applied = set(JobApplication.objects.filter(user=self.seeker).values_list('job_id', flat=True))
+        for job_id, job_status in statuses.items():
+            self.assertEqual(job_status, 'applied' if job_id in applied else None)
+
+    def test_keyword_results_match_indexed_terms(self):
+        response, _ = self.search({'keyword': 'spring'})
+        titles = [job['title'] for job in response.data['results']]
+        self.assertEqual(response.data['count'], 6)
+        self.assertTrue(all(title.startswith('Java Engineer') for title in titles))
+
+    def test_invalid_filters_are_rejected(self):
+        for query in ({'salary': 'lots'}, {'salary': '900-100'}, {'job_type': 'Contract'}):
+            with self.subTest(query=query):
+                response = self.client.get('/api/job-search/', query)
+                self.assertEqual(response.status_code, 400)
+
+
+@override_settings(**API_TEST_SETTINGS)
+class JobDeadlineRuleTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(
+            username='employer', email='employer@example.com', password='pass12345', role='employer'
+        )
+        today = datetime.date.today()
+        cls.past = today - datetime.timedelta(days=5)
+        cls.jobs = {
+            name: Job.objects.create(
+                employer=cls.employer, title=f'{name} job', description='Build APIs.', skills_required='Python',
+                location_city='Pune', location_state='Maharashtra', job_type='Full-Time',
+                status=job_status, application_deadline=deadline,
+            )
+            for name, job_status, deadline in (
+                # `lapsed` is what the sweeper has not reached yet
+                ('lapsed', 'active', cls.past),
+                ('closed', 'inactive', cls.past),
+                ('open', 'active', today + datetime.timedelta(days=30)),
+            )
+        }
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.employer)
+
+    def edit(self, name, **data):
+        job = self.jobs[name]
+        payload = {'status': job.status, 'application_deadline': job.application_deadline, **data}
+        return self.client.patch(f'/api/jobs/{job.pk}/', payload, format='json')
+
+    def bulk_update(self, names, **data):
+        job_ids = [self.jobs[name].pk for name in names]
+        return self.client.post('/api/jobs/bulk-update/', {'job_ids': job_ids, **data}, format='json')
+
+    def test_edits_that_keep_status_and_deadline_are_accepted(self):
+        # The edit form resends both fields with every save
+        response = self.edit('lapsed', title='Fixed typo')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(Job.objects.get(pk=self.jobs['lapsed'].pk).title, 'Fixed typo')
+
+    def test_changes_that_leave_a_job_active_past_its_deadline_are_rejected(self):
+        self.assertEqual(self.edit('closed', status='active').status_code, 400)
+        self.assertEqual(self.edit('open', application_deadline=self.past).status_code, 400)
+        self.assertEqual(self.edit('lapsed', status='inactive').status_code, 200)
+
+    def test_bulk_update_reports_the_conflicting_jobs(self):
+        response = self.bulk_update(['lapsed', 'closed', 'open'], status='active')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['job_ids'], [self.jobs['closed'].pk])
+
+        response = self.bulk_update(['lapsed', 'closed', 'open'], application_deadline=self.past.isoformat())
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['job_ids'], [self.jobs['open'].pk])
+
+        response = self.bulk_update(['closed'], status='active', application_deadline=self.past.isoformat())
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Job.objects.get(pk=self.jobs['closed'].pk).status, 'inactive')
+
+    def test_bulk_update_applies_valid_changes(self):
+        response = self.bulk_update(['lapsed', 'closed', 'open'], status='inactive', application_deadline=self.past.isoformat())
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json(), {'updated': 3, 'skipped': 0})
+        self.assertEqual(
+            set(Job.objects.filter(employer=self.employer).values_list('status', 'application_deadline')),
+            {('inactive', self.past)},
+        )
+
+
+class ListBuffer(BackgroundBuffer):
+    # Writes to a list; the item 'bad' always fails, like a row whose FK target is gone
+    def __init__(self):
+        self.written = []
+        super().__init__(flush_interval=60)
+
+    def empty(self):
+        return []
+
+    def add(self, pending, item):
+        pending.append(item)
+
+    def split(self, pending):
+        return [[item] for item in pending]
+
+    def write(self, pending):
+        if 'bad' in pending:
+            raise ValueError('cannot write bad')
+        self.written.extend(pending)
+        return len(pending)
+
+
+class BackgroundBufferTests(SimpleTestCase):
+    def test_failing_items_are_isolated_then_dropped(self):
+        buffer = ListBuffer()
+        for item in ('a', 'bad', 'b'):
+            buffer.record(item)
+        with self.assertLogs('users.buffers', 'WARNING'):
+            self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(buffer.written, ['a', 'b'])
+
+        buffer.record('c')
+        self.assertEqual(buffer.flush(), 1)
+        with self.assertLogs('users.buffers', 'ERROR') as logs:
+            self.assertEqual(buffer.flush(), 0)
+        self.assertIn('dropping an item after 3 failed attempts', logs.output[0])
+        self.assertEqual(buffer._retries, [])
+        self.assertEqual(buffer.written, ['a', 'b', 'c'])
+
+
+class JobViewBufferTests(TestCase):
+    def test_zero_interval_writes_each_view(self):
+        employer = User.objects.create_user(
+            username='employer', email='employer@example.com', password='pass12345', role='employer'
+        )
+        job = Job.objects.create(
+            employer=employer, title='Python Developer', description='Build APIs.', skills_required='Python',
+            location_city='Pune', location_state='Maharashtra', job_type='Full-Time',
+        )
+        buffer = JobViewBuffer(flush_interval=0)
+        buffer.record(job.pk)
+        buffer.record(job.pk)
+        job.refresh_from_db()
+        self.assertEqual(job.views, 2)
+        self.assertIsNone(buffer._thread)
+
+
+@override_settings(**API_TEST_SETTINGS)
+class ApplicationBulkStatusTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(
+            username='employer', email='employer@example.com', password='pass12345', role='employer'
+        )
+        cls.job, other_job = (
+            Job.objects.create(
+                employer=cls.employer, title=title, description='Build APIs.', skills_required='Python',
+                location_city='Pune', location_state='Maharashtra', job_type='Full-Time',
+            )
+            for title in ('Python Developer', 'Data Engineer')
+        )
+        cls.applications = {}
+        for status in ('applied', 'under_review', 'rejected', 'shortlisted', 'other_job'):
+            seeker = User.objects.create_user(
+                username=status, email=f'{status}@example.com', password='pass12345', role='job_seeker'
+            )
+            cls.applications[status] = JobApplication.objects.create(
+                job=other_job if status == 'other_job' else cls.job, user=seeker,
+                status='applied' if status == 'other_job' else status,
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.employer)
+
+    def change_status(self, status, names):
+        return self.client.post(
+            f'/api/jobs/{self.job.pk}/applications/bulk-status/',
+            {'status': status, 'application_ids': [self.applications[name].pk for name in names]},
+            format='json',
+        )
+
+    def test_only_open_applications_of_the_job_change(self):
+        response = self.change_status('shortlisted', self.applications)
+        self.assertEqual(response.status_code, 200, response.content)
+        ids = {name: application.pk for name, application in self.applications.items()}
+        self.assertEqual(response.json()['updated'], sorted([ids['applied'], ids['under_review']]))
+        self.assertEqual(
+            response.json()['skipped'], sorted([ids['rejected'], ids['shortlisted'], ids['other_job']])
+        )
+        statuses = dict(JobApplication.objects.values_list('pk', 'status'))
+        self.assertEqual(
+            {name: statuses[pk] for name, pk in ids.items()},
+            {'applied': 'shortlisted', 'under_review': 'shortlisted', 'rejected': 'rejected',
+             'shortlisted': 'shortlisted', 'other_job': 'applied'},
+        )
+
+    def test_one_notification_per_changed_application(self):
+        self.change_status('hired', ['applied', 'rejected', 'shortlisted'])
+        notified = Notification.objects.values_list('user__username', flat=True)
+        self.assertEqual(sorted(notified), ['applied', 'shortlisted'])
+        # Repeating the request changes nothing and notifies no one
+        response = self.change_status('hired', ['applied', 'rejected', 'shortlisted'])
+        self.assertEqual(response.json()['updated'], [])
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_funnel_moves_with_the_changed_applications(self):
+        self.change_status('under_review', ['applied', 'rejected', 'shortlisted'])
+        self.assertEqual(
+            funnel_counts([self.job.pk])[self.job.pk],
+            {'applied': 0, 'under_review': 3, 'shortlisted': 0, 'rejected': 1, 'hired': 0},
+        )
+        self.assertEqual(reconcile_funnels(), (2, 0))
+
+    def test_other_employers_are_refused(self):
+        other = User.objects.create_user(
+            username='other', email='other@example.com', password='pass12345', role='employer'
+        )
+        self.client.force_authenticate(other)
+        self.assertEqual(self.change_status('hired', ['applied']).status_code, 403)
+        self.assertEqual(JobApplication.objects.get(pk=self.applications['applied'].pk).status, 'applied')
+
+
+class JobFunnelTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        employer = User.objects.create_user(
+            username='employer', email='employer@example.com', password='pass12345', role='employer'
+        )
+        cls.job = Job.objects.create(
+            employer=employer, title='Python Developer', description='Build APIs.', skills_required='Python',
+            location_city='Pune', location_state='Maharashtra', job_type='Full-Time',
+        )
+        cls.seekers = [
+            User.objects.create_user(
+                username=f'seeker{i}', email=f'seeker{i}@example.com', password='pass12345', role='job_seeker'
+            )
+            for i in range(3)
+        ]
+
+    def funnel(self):
+        return funnel_counts([self.job.pk])[self.job.pk]
+
+    def test_rollup_follows_application_saves_and_deletes(self):
+        first, second, third = (JobApplication.objects.create(job=self.job, user=seeker) for seeker in self.seekers)
+        second.status = 'shortlisted'
+        second.save()
+        third.status = 'rejected'
+        third.save(update_fields=['status'])
+        first.delete()
+        self.assertEqual(
+            self.funnel(), {'applied': 0, 'under_review': 0, 'shortlisted': 1, 'rejected': 1, 'hired': 0}
+        )
+        self.assertEqual(reconcile_funnels(), (1, 0))
+
+    def test_reconcile_rewrites_drifted_rows(self):
+        for seeker in self.seekers:
+            JobApplication.objects.create(job=self.job, user=seeker)
+        # queryset.update() sends no signals, so the rollup drifts
+        JobApplication.objects.filter(user=self.seekers[0]).update(status='hired')
+        JobFunnel.objects.filter(job=self.job).delete()
+        self.assertEqual(reconcile_funnels(), (1, 1))
+        self.assertEqual(
+            self.funnel(), {'applied': 2, 'under_review': 0, 'shortlisted': 0, 'rejected': 0, 'hired': 1}
+        )
+        JobApplication.objects.filter(user=self.seekers[1]).update(status='under_review')
+        self.assertEqual(reconcile_funnels(batch_size=1), (1, 1))
+        self.assertEqual(self.funnel()['under_review'], 1)
+
+
+@override_settings(**API_TEST_SETTINGS)
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        employer = User.objects.create_user(
+            username='employer', email='employer@example.com', password='pass12345', role='employer'
+        )
+        for i in range(8):
+            Job.objects.create(
+                employer=employer, title=f'Python Developer {i}', description='Build APIs with Python.' * (i % 3 + 1),
+                skills_required='Python', location_city='Pune', location_state='Maharashtra', job_type='Full-Time',
+            )
+        # Ties on created_at must be broken by the primary key
+        tied = Job.objects.order_by('pk').values_list('pk', flat=True)[2:6]
+        Job.objects.filter(pk__in=list(tied)).update(created_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc))
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def walk(self, url, direction):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append([job['id'] for job in response.data['results']])
+            url = response.data[direction]
+        return pages, response.data
+
+    def assertRoundTrip(self, url, expected):
+        forward, last = self.walk(url, 'next')
+        self.assertEqual([pk for page in forward for pk in page], expected)
+        self.assertTrue(all(len(page) == 3 for page in forward[:-1]))
+        self.assertIsNotNone(last['previous'])
+        backward, first = self.walk(last['previous'], 'previous')
+        self.assertEqual(backward, forward[-2::-1])
+        self.assertIsNone(first['previous'])
+
+    def test_job_list_pages_round_trip(self):
+        expected = list(Job.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+        self.assertRoundTrip('/api/jobs/?page_size=3', expected)
+
+    def test_ranked_search_pages_round_trip(self):
+        # Ranked pages seek on (rank, created_at, id); collect the full order in one page first
+        response = self.client.get('/api/job-search/', {'keyword': 'python', 'page_size': 100})
+        expected = [job['id'] for job in response.data['results']]
+        self.assertEqual(len(expected), 8)
+        self.assertRoundTrip('/api/job-search/?keyword=python&page_size=3', expected)
+
+    def test_tampered_cursor_is_rejected(self):
+        self.assertEqual(self.client.get('/api/jobs/', {'cursor': 'not-a-cursor'}).status_code, 404)
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_matches_drf_encoding_of_special_types(self):
+        data = {
+            'created_at': datetime.datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'deadline': datetime.date(2025, 4, 1),
+            'salary': decimal.Decimal('1250000.50'),
+            'label': gettext_lazy('Active'),
+            'skills': ('Python', 'Django'),
+        }
+        rendered = json.loads(ORJSONRenderer().render(data))
+        self.assertEqual(rendered, json.loads(JSONRenderer().render(data)))
+        self.assertEqual(rendered['created_at'], '2025-03-01T09:30:15.123456Z')
+
+    def test_parser_round_trip_and_errors(self):
+        body = ORJSONRenderer().render({'message': 'héllo', 'ids': [1, 2]})
+        self.assertEqual(ORJSONParser().parse(io.BytesIO(body)), {'message': 'héllo', 'ids': [1, 2]})
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"message": '))
+
+
+@override_settings(**API_TEST_SETTINGS)
+class JobApplicationSubmitTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = User.objects.create_user(
+            username='employer', email='employer@example.com', password='pass12345', role='employer'
+        )
+        cls.seeker = User.objects.create_user(
+            username='seeker', email='seeker@example.com', password='pass12345', role='job_seeker'
+        )
+        cls.job = Job.objects.create(
+            employer=cls.employer, title='Python Developer', description='Build APIs.',
+            skills_required='Python', location_city='Pune', location_state='Maharashtra',
+            job_type='Full-Time',
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.seeker)
+
+    def apply(self, **headers):
+        return self.client.post('/api/applications/', {'job': self.job.pk}, format='json', **headers)
+
+    def test_repeat_application_is_rejected_by_the_insert(self):
+        self.assertEqual(self.apply().status_code, 201)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.apply()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), ['You have already applied for this job.'])
+        # Only the error path re-checks the pair, after the INSERT was rejected
+        statements = [q['sql'] for q in queries.captured_queries]
+        inserts = [i for i, sql in enumerate(statements) if sql.startswith(f"INSERT INTO {qn('users_jobapplication')}")]
+        rechecks = [i for i, sql in enumerate(statements) if sql.startswith(f"SELECT 1 AS {qn('a')} FROM {qn('users_jobapplication')}")]
+        self.assertEqual(len(inserts), 1, statements)
+        self.assertEqual(len(rechecks), 1, statements)
+        self.assertLess(inserts[0], rechecks[0])
+        self.assertEqual(JobApplication.objects.filter(job=self.job).count(), 1)
+
+    def test_other_integrity_errors_are_not_reported_as_duplicates(self):
+        with mock.patch.object(JobApplicationSerializer, 'save', side_effect=IntegrityError('NOT NULL constraint failed')):
+            with self.assertRaises(IntegrityError):
+                self.apply()
+
+    def test_idempotency_key_replays_the_original_response(self):
+        first = self.apply(HTTP_IDEMPOTENCY_KEY='submit-1')
+        retry = self.apply(HTTP_IDEMPOTENCY_KEY='submit-1')
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry.json()['id'], first.json()['id'])
+        self.assertEqual(retry.headers['Idempotent-Replayed'], 'true')
+        self.assertEqual(JobApplication.objects.filter(job=self.job).count(), 1)
+
+
+class FileRangeTests(SimpleTestCase):
+    def test_parse_range(self):
+        self.assertEqual(parse_range('bytes=0-99', 1000), (0, 99))
+        self.assertEqual(parse_range('bytes=900-', 1000), (900, 999))
+        self.assertEqual(parse_range('bytes=-100', 1000), (900, 999))
+        self.assertEqual(parse_range('bytes=990-2000', 1000), (990, 999))
+        self.assertIs(parse_range('bytes=1000-', 1000), False)
+        self.assertIsNone(parse_range('bytes=0-1,5-6', 1000))
+        self.assertIsNone(parse_range('items=0-1', 1000))
+
+
+@override_settings(**API_TEST_SETTINGS)
+class ProfilePictureURLTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+        self.user = User.objects.create_user(
+            username='seeker', email='seeker@example.com', password='pass12345', role='job_seeker'
+        )
+        self.user.profile_picture = SimpleUploadedFile('me.png', b'picture', content_type='image/png')
+        self.user.save()
+
+    def picture_url(self):
+        parts = urlsplit(UserSearchSerializer(self.user).data['profile_picture'])
+        return f'{parts.path}?{parts.query}'
+
+    def test_signed_url_works_without_credentials(self):
+        url = self.picture_url()
+        response = APIClient().get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), b'picture')
+        self.assertEqual(APIClient().get(url.split('&sig=')[0]).status_code, 401)
+        self.assertEqual(APIClient().get(url[:-1] + ('A' if url[-1] != 'A' else 'B')).status_code, 401)
+
+    def test_replacing_the_picture_retires_old_urls(self):
+        old_url = self.picture_url()
+        self.user.profile_picture = SimpleUploadedFile('new.png', b'new picture', content_type='image/png')
+        self.user.save()
+        self.assertEqual(APIClient().get(old_url).status_code, 401)
+        self.assertEqual(APIClient().get(self.picture_url()).status_code, 200)
+
+
+class ParseSkillsTests(SimpleTestCase):
+    def test_slashes_stay_inside_skill_names(self):
+        self.assertEqual(
+            parse_skills('CI/CD, TCP/IP; UI/UX\n  Python | Django '),
+            {'ci/cd': 'CI/CD', 'tcp/ip': 'TCP/IP', 'ui/ux': 'UI/UX', 'python': 'Python', 'django': 'Django'},
+        )
+
+
+class SkillAliasQueryTests(TestCase):
+    def test_aliases_added_after_tagging_still_match(self):
+        employer = User.objects.create_user(
+            username='employer', email='employer@example.com', password='pass12345', role='employer'
+        )
+
+        def post(skills):
+            return Job.objects.create(
+                employer=employer, title='Developer', description='Build apps.', skills_required=skills,
+                location_city='Pune', location_state='Maharashtra', job_type='Full-Time',
+            )
+
+        def matches(*names):
+            return set(filter_by_skills(Job.objects.all(), names).values_list('pk', flat=True))
+
+        tagged_before = post('RB, SQL')
+        ruby, _ = Skill.objects.get_or_create(normalized_name='ruby', defaults={'name': 'Ruby'})
+        SkillAlias.objects.create(alias='rb', skill=ruby)
+        tagged_after = post('Ruby')
+
+        self.assertEqual(matches('RB'), {tagged_before.pk, tagged_after.pk})
+        self.assertEqual(matches('ruby'), {tagged_before.pk, tagged_after.pk})
+        self.assertEqual(matches('Ruby', 'SQL'), {tagged_before.pk})
+        self.assertEqual(matches('Ruby', 'Rust'), set())
+
+
+class SavedSearchLocationTests(TestCase):
+    def test_location_wildcards_match_literally(self):
+        employer = User.objects.create_user(
+            username='employer', email='employer@example.com', password='pass12345', role='employer'
+        )
+        seeker = User.objects.create_user(
+            username='seeker', email='seeker@example.com', password='pass12345', role='job_seeker'
+        )
+        for location in ('%', '_une', 'pun', 'MAHA', 'Delhi', ''):
+            SavedSearch.objects.create(user=seeker, name=location or 'anywhere', location=location)
+        job = Job(
+            employer=employer, title='Python Developer', description='Build APIs.', skills_required='Python',
+            location_city='Pune', location_state='Maharashtra', job_type='Full-Time',
+        )
+        names = set(matching_searches(job).values_list('name', flat=True))
+        self.assertEqual(names, {'pun', 'MAHA', 'anywhere'})
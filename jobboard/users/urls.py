@@ -16,7 +16,16 @@ from .views import (
     JobApplicationRetrieveUpdateAPIView,
     JobApplicationsForJobAPIView,
     DownloadResumeAPIView,
+    JobDescriptionPDFAPIView,
+    ProfilePictureAPIView,
+    CompanyLogoAPIView,
     JobSearchAPIView,
+    JobRecommendationsAPIView,
+    JobImportAPIView,
+    JobBulkUpdateAPIView,
+    ApplicationBulkStatusAPIView,
+    SavedSearchListCreateAPIView,
+    SavedSearchRetrieveUpdateDestroyAPIView,
     UserSearchView,
     ConversationListView,  # Updated import
     MessageListView,       # Updated import
@@ -57,6 +66,8 @@ urlpatterns = [
     # Job and company profile API endpoints
     path('jobs/', JobListCreateAPIView.as_view(), name='api_jobs_list_create'),
     path('jobs/<int:pk>/', JobRetrieveUpdateDestroyAPIView.as_view(), name='api_job_rud'),
+    path('jobs/import/', JobImportAPIView.as_view(), name='api_jobs_import'),
+    path('jobs/bulk-update/', JobBulkUpdateAPIView.as_view(), name='api_jobs_bulk_update'),
     path('employer/jobs/', EmployerJobsAPIView.as_view(), name='api_employer_jobs_list'),
     path('company-profile/', CompanyProfileRetrieveUpdateAPIView.as_view(), name='api_company_profile'),
 
@@ -64,10 +75,17 @@ urlpatterns = [
     path('applications/', JobApplicationListCreateAPIView.as_view(), name='api_applications_list_create'),
     path('applications/<int:pk>/', JobApplicationRetrieveUpdateAPIView.as_view(), name='api_applications_rud'),
     path('jobs/<int:job_id>/applications/', JobApplicationsForJobAPIView.as_view(), name='api_job_applications_list'),
+    path('jobs/<int:job_id>/applications/bulk-status/', ApplicationBulkStatusAPIView.as_view(), name='api_job_applications_bulk_status'),
     path('applications/<int:application_id>/download-resume/', DownloadResumeAPIView.as_view(), name='api_download_resume'),
+    path('jobs/<int:pk>/description-pdf/', JobDescriptionPDFAPIView.as_view(), name='api_job_description_pdf'),
+    path('users/<int:pk>/profile-picture/', ProfilePictureAPIView.as_view(), name='api_profile_picture'),
+    path('companies/<int:employer_id>/logo/', CompanyLogoAPIView.as_view(), name='api_company_logo'),
 
     # Job search API endpoint
     path('job-search/', JobSearchAPIView.as_view(), name='api_job_search'),
+    path('recommendations/', JobRecommendationsAPIView.as_view(), name='api_job_recommendations'),
+    path('saved-searches/', SavedSearchListCreateAPIView.as_view(), name='api_saved_searches'),
+    path('saved-searches/<int:pk>/', SavedSearchRetrieveUpdateDestroyAPIView.as_view(), name='api_saved_search_detail'),
 
     # Messaging API endpoints
     path('conversations/', ConversationListView.as_view(), name='api_conversations_list'),
@@ -0,0 +1,71 @@
+import atexit
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+from .buffers import BackgroundBuffer
+from .caching import touch_versions, version_key
+from .models import Job
+
+
+class JobViewBuffer(BackgroundBuffer):
+    """
+    Per-process accumulator for job detail views.
+
+    Requests only bump an in-memory counter; a background thread periodically
+    flushes the totals as `UPDATE ... SET views = views + n` statements, one per
+    distinct increment, so a popular posting never becomes a row-lock hotspot.
+    With an interval of 0 each view is written immediately.
+    """
+
+    thread_name = 'job-view-flusher'
+
+    def empty(self):
+        return Counter()
+
+    def add(self, pending, job_id):
+        pending[job_id] += 1
+
+    def split(self, pending):
+        return [Counter({job_id: count}) for job_id, count in pending.items()]
+
+    def write(self, pending):
+        by_increment = defaultdict(list)
+        for job_id, count in pending.items():
+            by_increment[count].append(job_id)
+        for increment, job_ids in by_increment.items():
+            Job.objects.filter(pk__in=job_ids).update(views=F('views') + increment)
+        # The employer dashboard reports total views too
+        employer_ids = Job.objects.filter(pk__in=list(pending)).values_list('employer_id', flat=True).distinct()
+        touch_versions(
+            *(version_key('job', job_id) for job_id in pending),
+            *(version_key('employer', employer_id) for employer_id in employer_ids),
+        )
+        return sum(pending.values())
+
+
+view_buffer = JobViewBuffer(getattr(settings, 'JOB_VIEW_FLUSH_INTERVAL', 10))
+atexit.register(view_buffer.flush)
+
+
+def viewer_key(request):
+    if request.user.is_authenticated:
+        return f'user:{request.user.pk}'
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+    if forwarded:
+        return f"ip:{forwarded.split(',')[0].strip()}"
+    return f"ip:{request.META.get('REMOTE_ADDR', '')}"
+
+
+def record_job_view(job_id, viewer=None):
+    """
+    Count one view of a job. Repeat views by the same viewer inside
+    JOB_VIEW_DEDUPE_WINDOW seconds are ignored (0 disables deduplication).
+    """
+    window = getattr(settings, 'JOB_VIEW_DEDUPE_WINDOW', 0)
+    if viewer and window > 0 and not cache.add(f'job_view:{job_id}:{viewer}', 1, window):
+        return False
+    view_buffer.record(job_id)
+    return True
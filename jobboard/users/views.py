@@ -1,26 +1,31 @@
+from collections import Counter
+from datetime import date
+
 from django.contrib.auth import get_user_model
 from rest_framework import generics, status, filters, serializers
 from rest_framework.permissions import IsAuthenticated, AllowAny, BasePermission
 from rest_framework.response import Response
-from rest_framework.exceptions import ValidationError, PermissionDenied
+from rest_framework.exceptions import NotAuthenticated, ValidationError, PermissionDenied
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
 from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from django.conf import settings
-from django.http import FileResponse, Http404
+from django.core.cache import cache
+from django.http import Http404
 from rest_framework import generics, mixins
 from rest_framework.generics import RetrieveUpdateAPIView
 from .models import (
     User, Job, JobApplication, CompanyProfile, Message, Notification, 
-    EmployerActivity, JobSeekerActivity, JobSeekerProfile
+    EmployerActivity, JobSeekerActivity, JobSeekerProfile, SavedSearch
 )
 from django.db.models import Q
 from django.core.mail import EmailMultiAlternatives
@@ -35,9 +40,35 @@ from .serializers import (
     UserSearchSerializer,
     ConversationSerializer,
     JobSeekerProfileSerializer,
+    RecommendedJobSerializer,
+    RankedJobApplicationSerializer,
+    SavedSearchSerializer,
+    JobSummarySerializer,
+    JobBulkUpdateSerializer,
+    ApplicationBulkStatusSerializer,
+    EmployerJobSerializer,
+    ACTIVE_PAST_DEADLINE_MESSAGE,
+    is_active_past_deadline,
+    requested_fields,
 )
 from rest_framework.response import Response
 from .filters import JobFilter
+from .queries import active_filter, compile_job_query, only_serialized_columns
+from .search import rank_jobs
+from .pagination import KeysetPagination, CountedKeysetPagination
+from .caching import (
+    AnonymousJobListCacheMixin, ConditionalGetMixin, invalidate_job_detail, invalidate_job_lists,
+    job_detail_cache_key, touch_versions, version_key,
+)
+from .facets import job_facets
+from .view_counts import record_job_view, viewer_key
+from .activity import record_applications_viewed
+from .funnel import adjust_funnel, employer_funnel
+from .idempotency import IdempotentCreateMixin
+from .file_delivery import has_file_signature, serve_file
+from .applicant_ranking import applicant_ranking, invalidate_applicant_ranking
+from .dedupe import find_duplicate
+from .job_import import import_format, import_jobs, iter_csv_rows, iter_ndjson_rows
 
 # Custom permissions for role-based access
 class IsAdmin(BasePermission):
@@ -56,6 +87,24 @@ class IsJobOwner(BasePermission):
     def has_object_permission(self, request, view, obj):
         return obj.employer == request.user
 
+class CompactJobListMixin:
+    """
+    GET lists render `summary_serializer_class` (or JobSerializer narrowed by
+    ?fields=) and SELECT only the columns that serializer reads.
+    """
+    summary_serializer_class = JobSummarySerializer
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET' and not requested_fields(self.request):
+            return self.summary_serializer_class
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method == 'GET':
+            queryset = only_serialized_columns(queryset, self.get_serializer())
+        return queryset
+
 # DRF APIView for registration
 class UserRegisterAPIView(APIView):
     permission_classes = [AllowAny]
@@ -101,16 +150,25 @@ class JobSeekerProfileRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
         profile, created = JobSeekerProfile.objects.get_or_create(user=self.request.user)
         return profile
 
-class CompanyProfileRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
+class CompanyProfileRetrieveUpdateAPIView(ConditionalGetMixin, generics.RetrieveUpdateAPIView):
     serializer_class = CompanyProfileSerializer
     permission_classes = [IsAuthenticated, IsEmployer]
 
+    def get_version_keys(self, request, obj=None):
+        return [version_key('company', request.user.pk)]
+
+    def get(self, request, *args, **kwargs):
+        return self.check_not_modified(request) or super().get(request, *args, **kwargs)
+
     def get_object(self):
         profile, created = CompanyProfile.objects.get_or_create(employer=self.request.user)
         return profile
 
     def perform_update(self, serializer):
+        # Saving the profile also copies the name and logo onto the employer's
+        # jobs (users.signals); cached listings embed them too
         profile = serializer.save()
+        invalidate_job_lists()
         EmployerActivity.objects.create(
             employer=self.request.user,
             activity_type='company_updated',
@@ -316,49 +374,12 @@ class AdminOnlyAPIView(APIView):
 
 custom_token_view = TokenObtainPairView.as_view(serializer_class=CustomTokenObtainPairSerializer)
 
-class JobListCreateAPIView(generics.ListCreateAPIView):
+class JobListCreateAPIView(AnonymousJobListCacheMixin, CompactJobListMixin, generics.ListCreateAPIView):
     serializer_class = JobSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
-        queryset = Job.objects.select_related('employer__company_profile').all()
-        
-        # Get filter parameters from request
-        keyword = self.request.query_params.get('keyword')
-        location = self.request.query_params.get('location')
-        job_type = self.request.query_params.get('job_type')
-        salary = self.request.query_params.get('salary')
-        
-        # Apply filters manually
-        if keyword:
-            queryset = queryset.filter(
-                Q(title__icontains=keyword) |
-                Q(description__icontains=keyword) |
-                Q(skills_required__icontains=keyword)
-            )
-        
-        if location:
-            queryset = queryset.filter(
-                Q(location_city__icontains=location) |
-                Q(location_state__icontains=location)
-            )
-        
-        if job_type:
-            queryset = queryset.filter(job_type__iexact=job_type)
-            
-        if salary:
-            if salary == '2000000+':
-                queryset = queryset.filter(salary_min__gte=2000000)
-            elif '-' in salary:
-                try:
-                    min_val, max_val = salary.split('-')
-                    queryset = queryset.filter(
-                        salary_min__gte=int(min_val),
-                        salary_max__lte=int(max_val)
-                    )
-                except (ValueError, TypeError):
-                    pass
-        
-        return queryset.order_by('-created_at')
+        return compile_job_query(self.request.query_params, user=self.request.user)
 
     def get_permissions(self):
         if self.request.method == 'GET':
@@ -370,23 +391,113 @@ class JobListCreateAPIView(generics.ListCreateAPIView):
         context['request'] = self.request
         return context
 
+    def create(self, request, *args, **kwargs):
+        self.duplicate = None
+        response = super().create(request, *args, **kwargs)
+        if self.duplicate:
+            job_id, title, similarity = self.duplicate
+            response.data['duplicate_warning'] = {
+                'job_id': job_id,
+                'title': title,
+                'similarity': similarity,
+                'message': f"This posting looks like a duplicate of '{title}'.",
+            }
+        return response
+
     def perform_create(self, serializer):
-        job = serializer.save(employer=self.request.user)
+        # MinHash/LSH lookup against the employer's jobs and all active jobs;
+        # a near-duplicate is still posted but linked to the original
+        self.duplicate = find_duplicate(
+            self.request.user,
+            serializer.validated_data.get('title', ''),
+            serializer.validated_data.get('description', ''),
+        )
+        job = serializer.save(
+            employer=self.request.user,
+            duplicate_of_id=self.duplicate[0] if self.duplicate else None,
+        )
+        invalidate_job_lists()
         EmployerActivity.objects.create(
             employer=self.request.user,
             activity_type='job_posted',
             description=f"Posted a new job: '{job.title}'"
         )
 
-class EmployerJobsAPIView(generics.ListAPIView):
-    serializer_class = JobSerializer
+class JobImportAPIView(APIView):
+    # Bulk posting: a CSV (header row of JobSerializer field names) or NDJSON upload in the 'file' field
     permission_classes = [IsAuthenticated, IsEmployer]
 
+    def post(self, request):
+        uploaded_file = request.FILES.get('file')
+        if uploaded_file is None:
+            raise ValidationError({'file': "Upload a CSV or NDJSON file."})
+        file_format = import_format(uploaded_file, request.query_params.get('format') or request.data.get('format'))
+        if file_format is None:
+            raise ValidationError({'file': "Unsupported file type. Use .csv, .ndjson or .jsonl."})
+
+        rows = iter_csv_rows(uploaded_file) if file_format == 'csv' else iter_ndjson_rows(uploaded_file)
+        summary = import_jobs(request.user, rows)
+        response_status = status.HTTP_201_CREATED if summary['created'] else status.HTTP_400_BAD_REQUEST
+        return Response(summary, status=response_status)
+
+
+class JobBulkUpdateAPIView(APIView):
+    # Close, reopen or re-date many of the caller's postings with one UPDATE
+    permission_classes = [IsAuthenticated, IsEmployer]
+
+    def post(self, request):
+        serializer = JobBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        job_ids = sorted(set(serializer.validated_data.pop('job_ids')))
+        changes = serializer.validated_data
+
+        # Ids the caller does not own are simply not matched
+        jobs = Job.objects.filter(employer=request.user, pk__in=job_ids)
+
+        # A change may not leave a job active with a deadline that has passed, as
+        # JobSerializer enforces for single updates; jobs the change leaves as they are pass
+        conflicts = None
+        if changes.get('status') == 'active' and 'application_deadline' not in changes:
+            conflicts = jobs.filter(application_deadline__lt=date.today()).exclude(status='active')
+        elif 'status' not in changes and is_active_past_deadline('active', changes['application_deadline']):
+            conflicts = jobs.filter(status='active').exclude(application_deadline=changes['application_deadline'])
+        if conflicts is not None:
+            conflicting_ids = sorted(conflicts.values_list('pk', flat=True))
+            if conflicting_ids:
+                return Response(
+                    {'application_deadline': [ACTIVE_PAST_DEADLINE_MESSAGE], 'job_ids': conflicting_ids},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        updated = jobs.update(**changes)
+        if updated:
+            invalidate_job_lists()
+            touch_versions(*(version_key('job', job_id) for job_id in job_ids))
+            summary = ', '.join(
+                f"{field.replace('_', ' ')} to {value if value is not None else 'none'}"
+                for field, value in changes.items()
+            )
+            EmployerActivity.objects.create(
+                employer=request.user,
+                activity_type='jobs_bulk_updated',
+                description=f"Updated {updated} job postings: set {summary}"
+            )
+        return Response({'updated': updated, 'skipped': len(job_ids) - updated})
+
+
+class EmployerJobsAPIView(CompactJobListMixin, generics.ListAPIView):
+    # Rows carry the job's hiring funnel from the JobFunnel rollup
+    serializer_class = EmployerJobSerializer
+    # The employer's job manager edits postings in place, so rows stay complete unless ?fields= is given
+    summary_serializer_class = EmployerJobSerializer
+    permission_classes = [IsAuthenticated, IsEmployer]
+    pagination_class = KeysetPagination
+
     def get_queryset(self):
         return Job.objects.filter(employer=self.request.user).order_by('-created_at')
 
 
-class JobRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+class JobRetrieveUpdateDestroyAPIView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Job.objects.all()
     serializer_class = JobSerializer
 
@@ -401,8 +512,43 @@ class JobRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         context['request'] = self.request  # needed for current_status
         return context
 
+    def get_version_keys(self, request, obj=None):
+        return [version_key('job', self.kwargs['pk'])]
+
+    def get_cached_body(self):
+        # Read-through cache of the viewer-independent serialized job
+        key = job_detail_cache_key(self.kwargs['pk'])
+        body = cache.get(key)
+        if body is None:
+            instance = self.get_object()
+            instance.applicant_status = None
+            body = dict(self.get_serializer(instance).data)
+            cache.set(key, body, settings.JOB_DETAIL_CACHE_TIMEOUT)
+        return body
+
+    def get_viewer_status(self, job_id):
+        user = self.request.user
+        if user.role != 'job_seeker':
+            return None
+        return JobApplication.objects.filter(job_id=job_id, user=user).values_list('status', flat=True).first()
+
+    def retrieve(self, request, *args, **kwargs):
+        if requested_fields(request):
+            return super().retrieve(request, *args, **kwargs)
+
+        body = self.get_cached_body()
+        # Buffered in memory and flushed in batches; owners viewing their own posting are not counted
+        if body['employer'] != request.user.pk:
+            record_job_view(body['id'], viewer_key(request))
+        not_modified = self.check_not_modified(request)
+        if not_modified:
+            return not_modified
+        return Response({**body, 'current_status': self.get_viewer_status(body['id'])})
+
     def perform_update(self, serializer):
         job = serializer.save()
+        invalidate_job_detail(job.pk)
+        invalidate_job_lists()
         EmployerActivity.objects.create(
             employer=self.request.user,
             activity_type='job_edited',
@@ -415,23 +561,22 @@ class JobRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
             activity_type='job_deleted',
             description=f"Deleted job posting: '{instance.title}'"
         )
+        job_id = instance.pk
         instance.delete()
+        invalidate_job_detail(job_id)
+        invalidate_job_lists()
 
-class JobApplicationListCreateAPIView(generics.ListCreateAPIView):
+class JobApplicationListCreateAPIView(IdempotentCreateMixin, generics.ListCreateAPIView):
     serializer_class = JobApplicationSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
         if user.role == 'job_seeker':
-            # Include related job, employer, and company_profile for efficiency
-            return JobApplication.objects.filter(user=user).select_related(
-                'job', 'job__employer', 'job__employer__company_profile'
-            )
+            # Company name and logo are denormalized onto the job
+            return JobApplication.objects.filter(user=user).select_related('job', 'user')
         elif user.role == 'employer':
-            return JobApplication.objects.filter(job__employer=user).select_related(
-                'job', 'user', 'job__employer__company_profile'
-            )
+            return JobApplication.objects.filter(job__employer=user).select_related('job', 'user')
         return JobApplication.objects.none()
 
     def perform_create(self, serializer):
@@ -442,19 +587,24 @@ class JobApplicationListCreateAPIView(generics.ListCreateAPIView):
         if job.application_deadline and job.application_deadline < timezone.now().date():
             raise ValidationError("The application deadline for this job has passed.")
 
-        # Check if the user has already applied for this job
-        if JobApplication.objects.filter(user=self.request.user, job=job).exists():
-            raise ValidationError("You have already applied for this job.")
-        
-        application = serializer.save(user=self.request.user)
+        # The (user, job) unique constraint rejects repeat applications in the
+        # insert itself; the savepoint keeps any outer transaction usable.
+        try:
+            with transaction.atomic():
+                application = serializer.save(user=self.request.user)
+        except IntegrityError:
+            # Only a clash on that constraint means "already applied"; the
+            # re-check costs a query on this error path alone
+            if JobApplication.objects.filter(user=self.request.user, job=job).exists():
+                raise ValidationError("You have already applied for this job.")
+            raise
 
         # Notify the employer about the new application
-        employer = application.job.employer
         applicant_name = application.user.full_name
         job_title = application.job.title
 
         Notification.objects.create(
-            user=employer,
+            user_id=application.job.employer_id,
             message=f"You have a new application from {applicant_name} for the job '{job_title}'.",
             link=f"/employer/jobs/{application.job.id}/applications"
         )
@@ -477,118 +627,234 @@ class JobApplicationRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
         raise PermissionDenied("You do not have permission to view this application.")
 
 class DownloadResumeAPIView(APIView):
-    permission_classes = [IsAuthenticated, IsEmployer]
+    permission_classes = [IsAuthenticated]
 
     def get(self, request, application_id):
-        application = get_object_or_404(JobApplication, id=application_id)
+        application = get_object_or_404(
+            JobApplication.objects.select_related('job').only('resume', 'user_id', 'job__employer_id'),
+            id=application_id,
+        )
 
-        # Check if the user is the employer for the job associated with the application
-        if application.job.employer != request.user:
+        # The employer for the job and the applicant themselves may download it
+        if request.user.pk not in (application.job.employer_id, application.user_id):
             raise PermissionDenied("You do not have permission to download this resume.")
 
-        if not application.resume or not application.resume.path:
+        if not application.resume:
             raise Http404("Resume file not found.")
+        return serve_file(request, application.resume, as_attachment=True)
 
-        try:
-            return FileResponse(application.resume.open('rb'), as_attachment=True, filename=application.resume.name)
-        except FileNotFoundError:
-            raise Http404("Resume file not found on disk.")
+
+class JobDescriptionPDFAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        job = get_object_or_404(Job.objects.only('job_description_pdf'), pk=pk)
+        return serve_file(request, job.job_description_pdf)
+
+
+class ProfilePictureAPIView(APIView):
+    # Serializers hand out signed URLs, since <img src> sends no Authorization header
+    permission_classes = [AllowAny]
+
+    def get(self, request, pk):
+        user = get_object_or_404(User.objects.only('profile_picture'), pk=pk)
+        if not (request.user.is_authenticated or has_file_signature(request, user.profile_picture)):
+            raise NotAuthenticated()
+        return serve_file(request, user.profile_picture)
+
+
+class CompanyLogoAPIView(APIView):
+    # Logos appear on the public job listings
+    permission_classes = [AllowAny]
+
+    def get(self, request, employer_id):
+        profile = get_object_or_404(CompanyProfile.objects.only('logo'), employer_id=employer_id)
+        return serve_file(request, profile.logo, public=True)
 
 
 class JobApplicationsForJobAPIView(generics.ListAPIView):
     serializer_class = JobApplicationSerializer
     permission_classes = [IsAuthenticated, IsEmployer]
 
+    def get_job(self):
+        if not hasattr(self, 'job'):
+            job = get_object_or_404(Job, id=self.kwargs.get('job_id'))
+            if job.employer_id != self.request.user.pk:
+                raise PermissionDenied("You do not have permission to view applications for this job.")
+            self.job = job
+        return self.job
+
     def get_queryset(self):
-        job_id = self.kwargs.get('job_id')
-        job = get_object_or_404(Job, id=job_id)
+        return JobApplication.objects.filter(job=self.get_job()).select_related('job', 'user')
+
+    def list(self, request, *args, **kwargs):
+        # Logged asynchronously, at most once per job per window (users.activity)
+        record_applications_viewed(request.user.pk, self.get_job())
+
+        # ?ranked=true orders applicants by the cached vectorized match score
+        if request.query_params.get('ranked', '').lower() not in ('1', 'true', 'yes'):
+            return super().list(request, *args, **kwargs)
+
+        applications = {
+            application.pk: application
+            for application in self.get_queryset()
+        }
+        ranked = []
+        for application_id, score in applicant_ranking(self.job):
+            application = applications.pop(application_id, None)
+            if application is not None:
+                application.match_score = score
+                ranked.append(application)
+        # Anything submitted after the ranking was cached goes last, unscored
+        ranked.extend(applications.values())
+
+        serializer = RankedJobApplicationSerializer(ranked, many=True, context=self.get_serializer_context())
+        return Response(serializer.data)
 
-        if job.employer != self.request.user:
-            raise PermissionDenied("You do not have permission to view applications for this job.")
+class ApplicationBulkStatusAPIView(APIView):
+    # Move many applications of one job to a new status with a single UPDATE
+    permission_classes = [IsAuthenticated, IsEmployer]
 
-        # Track activity
-        EmployerActivity.objects.create(
-            employer=self.request.user,
-            activity_type='application_viewed',
-            description=f"Viewed applications for job: '{job.title}'"
+    def post(self, request, job_id):
+        job = get_object_or_404(Job.objects.only('pk', 'employer_id', 'title'), id=job_id)
+        if job.employer_id != request.user.pk:
+            raise PermissionDenied("You can only update applications for your own jobs.")
+        serializer = ApplicationBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        new_status = serializer.validated_data['status']
+        application_ids = set(serializer.validated_data['application_ids'])
+
+        # Rejected applications are final, and unchanged ones need no notification
+        transitions = (
+            JobApplication.objects.filter(job=job, pk__in=application_ids)
+            .exclude(status='rejected')
+            .exclude(status=new_status)
         )
+        with transaction.atomic():
+            changed = list(transitions.select_for_update().values_list('pk', 'user_id', 'status'))
+            if changed:
+                transitions.filter(pk__in=[pk for pk, _, _ in changed]).update(status=new_status)
+                deltas = Counter({new_status: len(changed)})
+                deltas.subtract(status for _, _, status in changed)
+                adjust_funnel(job.pk, deltas)
+                status_display = dict(JobApplication.STATUS_CHOICES)[new_status]
+                Notification.objects.bulk_create([
+                    Notification(
+                        user_id=user_id,
+                        message=f"The status of your application for '{job.title}' has been updated to {status_display}.",
+                        link="/job-seeker/applications"
+                    )
+                    for _, user_id, _ in changed
+                ])
+
+        if changed:
+            # queryset.update() bypasses the post_save signals
+            invalidate_applicant_ranking(job.pk)
+            touch_versions(
+                version_key('job', job.pk),
+                version_key('employer', job.employer_id),
+                *{version_key('seeker', user_id) for _, user_id, _ in changed},
+            )
+        updated_ids = sorted(pk for pk, _, _ in changed)
+        return Response({
+            'status': new_status,
+            'updated': updated_ids,
+            'skipped': sorted(application_ids - set(updated_ids)),
+        })
 
-        return JobApplication.objects.filter(job=job)
 
-# In your views.py, update the JobSearchAPIView
-class JobSearchAPIView(generics.ListAPIView):
+class JobSearchAPIView(AnonymousJobListCacheMixin, CompactJobListMixin, generics.ListAPIView):
     serializer_class = JobSerializer
     permission_classes = [AllowAny]
+    pagination_class = CountedKeysetPagination
 
     def get_queryset(self):
-        queryset = Job.objects.all()
-        
-        # Debug logging
-        print(f"DEBUG: All query params: {dict(self.request.query_params)}")
-        
-        keyword = self.request.query_params.get('keyword')
-        location = self.request.query_params.get('location')
-        job_type = self.request.query_params.get('job_type')
-        salary = self.request.query_params.get('salary')
-        
-        # Debug salary specifically
-        print(f"DEBUG: Salary parameter received: '{salary}' (type: {type(salary)})")
-        
-        # Apply other filters first
-        if keyword:
-            queryset = queryset.filter(
-                Q(title__icontains=keyword) |
-                Q(description__icontains=keyword) |
-                Q(skills_required__icontains=keyword)
-            )
-            print(f"DEBUG: After keyword filter: {queryset.count()} jobs")
-            
-        if location:
-            queryset = queryset.filter(Q(location_city__icontains=location) | Q(location_state__icontains=location))
-            print(f"DEBUG: After location filter: {queryset.count()} jobs")
-            
-        if job_type:
-            queryset = queryset.filter(job_type__iexact=job_type)
-            print(f"DEBUG: After job_type filter: {queryset.count()} jobs")
-
-        # Detailed salary filtering with debugging
-        if salary:
-            print(f"DEBUG: Processing salary filter: {salary}")
-            if salary == '2000000+':
-                queryset = queryset.filter(salary_min__gte=2000000)
-                print(f"DEBUG: Applied 2000000+ filter, result: {queryset.count()} jobs")
-            elif '-' in salary:
-                try:
-                    min_val, max_val = salary.split('-')
-                    min_val = int(min_val)
-                    max_val = int(max_val)
-                    print(f"DEBUG: Salary range: {min_val} - {max_val}")
-                    
-                    # Check both salary_min and salary_max fields
-                    queryset = queryset.filter(
-                        salary_min__gte=min_val,
-                        salary_max__lte=max_val
-                    )
-                    print(f"DEBUG: Applied range filter, result: {queryset.count()} jobs")
-                    
-                    # Alternative approach - check if job salary overlaps with range
-                    # queryset = queryset.filter(
-                    #     Q(salary_min__lte=max_val) & Q(salary_max__gte=min_val)
-                    # )
-                    
-                except (ValueError, TypeError) as e:
-                    print(f"DEBUG: Error parsing salary range: {e}")
-            else:
-                print(f"DEBUG: Unrecognized salary format: {salary}")
-
-        print(f"DEBUG: Final queryset count: {queryset.count()}")
-        return queryset.order_by('-created_at')
+        return compile_job_query(self.request.query_params, user=self.request.user)
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context['request'] = self.request
         return context
 
+    # ?facets=true adds per job_type / location / salary band counts for the
+    # whole result set, computed in one grouped query before pagination.
+    def facets_requested(self):
+        return self.request.query_params.get('facets', '').lower() in ('1', 'true', 'yes')
+
+    def paginate_queryset(self, queryset):
+        self.facets = job_facets(queryset) if self.facets_requested() else None
+        return super().paginate_queryset(queryset)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.facets is not None:
+            response.data['facets'] = self.facets
+        return response
+
+
+
+class JobRecommendationsAPIView(generics.ListAPIView):
+    serializer_class = RecommendedJobSerializer
+    permission_classes = [IsAuthenticated, IsJobSeeker]
+    default_limit = 20
+    max_limit = 50
+
+    def get_limit(self):
+        try:
+            return max(1, min(int(self.request.query_params.get('limit', self.default_limit)), self.max_limit))
+        except ValueError:
+            return self.default_limit
+
+    def get_queryset(self):
+        # Served from the lists precomputed by `manage.py compute_recommendations`
+        user = self.request.user
+        applied = JobApplication.objects.filter(user=user).values('job')
+        return (
+            Job.objects.filter(active_filter(), recommendations__user=user)
+            .exclude(pk__in=applied)
+            .annotate(match_score=F('recommendations__score'))
+            .order_by('-match_score')
+        )
+
+    def get_fallback_queryset(self):
+        # New seekers without a precomputed list: rank their skills against the search index
+        profile = JobSeekerProfile.objects.filter(user=self.request.user).only('skills').first()
+        if not profile or not profile.skills.strip():
+            return Job.objects.none()
+        applied = JobApplication.objects.filter(user=self.request.user).values('job')
+        queryset = rank_jobs(
+            Job.objects.filter(active_filter()).exclude(pk__in=applied),
+            profile.skills,
+        )
+        if 'search_rank' not in queryset.query.annotations:
+            return Job.objects.none()
+        return queryset.annotate(match_score=F('search_rank')).order_by('-match_score')
+
+    def list(self, request, *args, **kwargs):
+        limit = self.get_limit()
+        jobs = list(self.get_queryset()[:limit]) or list(self.get_fallback_queryset()[:limit])
+        serializer = self.get_serializer(jobs, many=True)
+        return Response(serializer.data)
+
+
+class SavedSearchListCreateAPIView(generics.ListCreateAPIView):
+    # New postings matching a saved search raise a notification (see users.percolator)
+    serializer_class = SavedSearchSerializer
+    permission_classes = [IsAuthenticated, IsJobSeeker]
+
+    def get_queryset(self):
+        return SavedSearch.objects.filter(user=self.request.user).order_by('-created_at')
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+
+class SavedSearchRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+    serializer_class = SavedSearchSerializer
+    permission_classes = [IsAuthenticated, IsJobSeeker]
+
+    def get_queryset(self):
+        return SavedSearch.objects.filter(user=self.request.user)
 
 
 class ConversationListAPIView(generics.ListAPIView):
@@ -686,9 +952,16 @@ class UnreadNotificationCountAPIView(generics.GenericAPIView):
         unread_count = Notification.objects.filter(user=request.user, is_read=False).count()
         return Response({'unread_count': unread_count})
 
-class EmployerDashboardAPIView(APIView):
+class EmployerDashboardAPIView(ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsEmployer]
+
+    def get_version_keys(self, request, obj=None):
+        return [version_key('employer', request.user.pk)]
+
     def get(self, request):
+        not_modified = self.check_not_modified(request)
+        if not_modified:
+            return not_modified
         user = request.user
         jobs = Job.objects.filter(employer=user)
         applications = JobApplication.objects.filter(job__employer=user)
@@ -696,13 +969,20 @@ class EmployerDashboardAPIView(APIView):
         return Response({
             'job_count': jobs.count(),
             'application_count': applications.count(),
+            'funnel': employer_funnel(user),
             'recent_activities': EmployerActivitySerializer(recent_activities, many=True).data,
         })
 
-class JobSeekerDashboardAPIView(APIView):
+class JobSeekerDashboardAPIView(ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsJobSeeker]
 
+    def get_version_keys(self, request, obj=None):
+        return [version_key('seeker', request.user.pk)]
+
     def get(self, request):
+        not_modified = self.check_not_modified(request)
+        if not_modified:
+            return not_modified
         user = request.user
         applications = JobApplication.objects.filter(user=user)
 
@@ -718,9 +998,16 @@ class JobSeekerDashboardAPIView(APIView):
         })
 
 
-class AdminDashboardAPIView(APIView):
+class AdminDashboardAPIView(ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get_version_keys(self, request, obj=None):
+        return [version_key('site')]
+
     def get(self, request):
+        not_modified = self.check_not_modified(request)
+        if not_modified:
+            return not_modified
         user_count = User.objects.count()
         job_count = Job.objects.count()
         application_count = JobApplication.objects.count()